@@ -1,5 +1,36 @@
-from typing import Type, Any, Callable
-from arganic.validators import Validator
+import asyncio
+import functools
+import inspect
+import keyword
+import os
+import threading
+import time
+import weakref
+from contextvars import ContextVar, Token
+from fractions import Fraction
+from typing import (
+    Type,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator
+)
+from arganic import profiling
+from arganic.validators import Validator, AsyncValidator
+
+VALIDATION: bool = os.environ.get('ARGANIC_MODE', '').lower() != 'off'
+"""
+Whether the decorators validate the values they handle, by default.
+
+Validation is on unless the `ARGANIC_MODE` environment variable is set
+to `off`, whatever the optimization level of the interpreter. The value
+is read when a decorator is applied.
+"""
 
 
 class Argument:
@@ -43,6 +74,18 @@ class Argument:
 
     <hr />
    """
+    __slots__ = (
+        '__default',
+        '_name',
+        '__read_only',
+        '__required',
+        '__type',
+        '__validator',
+        '__choices',
+        '__members',
+        '__unhashable_choices',
+    )
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         kwargs = args[0] if args else kwargs
         self.__default: Any = kwargs.get('default', None)
@@ -53,11 +96,34 @@ class Argument:
         self.__validator: Validator | tuple[Validator] = (
             kwargs.get('validator'))
         self.__choices: tuple = kwargs.get('choices')
+        self.__members: frozenset = frozenset()
+        self.__unhashable_choices: tuple = ()
+        if self.choices:
+            self.__hash_choices()
         if self.default is not None:
             self.validate(self.default)
         if self.choices:
             for choice in self.choices:
-                self.validate(choice)
+                self.__validate_choice(choice)
+
+    def __hash_choices(self) -> None:
+        members = set()
+        unhashable = []
+        for choice in self.__choices:
+            try:
+                members.add(choice)
+            except TypeError:
+                unhashable.append(choice)
+        self.__members = frozenset(members)
+        self.__unhashable_choices = tuple(unhashable)
+
+    def __validate_choice(self, choice: Any) -> None:
+        if choice is None:
+            return
+        if self.type is not Any and not isinstance(choice, self.type):
+            raise self._type_error(choice)
+        for validator in self._validators:
+            validator.validate(choice)
 
     @property
     def name(self) -> str:
@@ -160,10 +226,7 @@ class Argument:
                 and self.type is not Any
                 and not isinstance(value, self.type)
         ):
-            raise TypeError(
-                f'Option {self.name}: the Value "{value}" '
-                f'is not of type "{self.__type}".'
-            )
+            raise self._type_error(value)
         # Test for required
         if (
                 self.required
@@ -171,17 +234,14 @@ class Argument:
                 and value is not False
                 and self.default is None
         ):
-            raise ValueError(f'Option {self.name}: is required.')
+            raise self._required_error()
         # Check choices
         if (
                 self.choices
                 and (self.required or value is not None)
-                and value not in self.choices
+                and not self._in_choices(value)
         ):
-            raise ValueError(
-                f'Option {self.name}: {value} needs '
-                f'to be one of {self.__choices}.'
-            )
+            raise self._choices_error(value)
         # process all validators
         if value is not None:
             if isinstance(self.validator, Validator):
@@ -191,204 +251,2559 @@ class Argument:
                     validator.validate(value)
         return True
 
+    def is_valid(self, value: Any) -> bool:
+        """
+        Check the argument value based on the specified rules,
+        without raising nor building any exception.
 
-class ArgumentHandler:
+        Parameters
+        ----------
+        value : Any
+            The value to check.
+
+        Returns
+        -------
+        bool
+            True if the value is valid, False otherwise.
+        """
+        if (
+                value is not None
+                and self.__type is not Any
+                and not isinstance(value, self.__type)
+        ):
+            return False
+        if (
+                self.__required
+                and not value
+                and value is not False
+                and self.__default is None
+        ):
+            return False
+        if (
+                self.__choices
+                and (self.__required or value is not None)
+                and not self._in_choices(value)
+        ):
+            return False
+        if value is not None:
+            for validator in self._validators:
+                if not validator.is_valid(value):
+                    return False
+        return True
+
+    def _in_choices(self, value: Any) -> bool:
+        try:
+            if value in self.__members:
+                return True
+        except TypeError:
+            return value in self.__choices
+        return (
+            bool(self.__unhashable_choices)
+            and value in self.__unhashable_choices
+        )
+
+    def _type_error(self, value: Any) -> TypeError:
+        return TypeError(
+            f'Option {self.name}: the Value "{value}" '
+            f'is not of type "{self.__type}".'
+        )
+
+    def _required_error(self) -> ValueError:
+        return ValueError(f'Option {self.name}: is required.')
+
+    def _choices_error(self, value: Any) -> ValueError:
+        return ValueError(
+            f'Option {self.name}: {value} needs '
+            f'to be one of {self.__choices}.'
+        )
+
+    @property
+    def _validators(self) -> tuple[Validator, ...]:
+        if isinstance(self.validator, Validator):
+            return (self.validator,)
+        if isinstance(self.validator, tuple):
+            return self.validator
+        return ()
+
+    def _compile(
+            self,
+            asynchronous: bool = False
+    ) -> tuple[Callable[[Any], None], ...]:
+        """
+        Compile the validation rules of the argument into checks.
+
+        Only the rules the argument actually declares are compiled:
+        an untyped argument gets no type check, an argument without
+        validator gets no validator check, and so on.
+        Each check raises the same exceptions as validate().
+
+        Parameters
+        ----------
+        asynchronous : bool, default=False
+            Leave the AsyncValidators out, they are awaited apart.
+
+        Returns
+        -------
+        tuple[Callable]
+            The checks to run, in the order validate() runs them.
+        """
+        arg_type = self.type
+        choices = self.choices
+        checks = []
+        if arg_type is not Any:
+            def check_type(value: Any) -> None:
+                if value is not None and not isinstance(value, arg_type):
+                    raise self._type_error(value)
+            check_type.rule = 'type'
+            checks.append(check_type)
+        if self.required and self.default is None:
+            def check_required(value: Any) -> None:
+                if not value and value is not False:
+                    raise self._required_error()
+            check_required.rule = 'required'
+            checks.append(check_required)
+        in_choices = self._in_choices
+        if choices and self.required:
+            def check_choices(value: Any) -> None:
+                if not in_choices(value):
+                    raise self._choices_error(value)
+            check_choices.rule = 'choices'
+            checks.append(check_choices)
+        elif choices:
+            def check_choices(value: Any) -> None:
+                if value is not None and not in_choices(value):
+                    raise self._choices_error(value)
+            check_choices.rule = 'choices'
+            checks.append(check_choices)
+        for validator in self._validators:
+            if asynchronous and isinstance(validator, AsyncValidator):
+                continue
+
+            def check_validator(
+                    value: Any,
+                    validate: Callable = validator.validate
+            ) -> None:
+                if value is not None:
+                    validate(value)
+            check_validator.rule = type(validator).__name__
+            checks.append(check_validator)
+        return tuple(checks)
+
+
+class ArgumentError:
     """
-    Handles arguments or properties for decorated classes,
-    methods or functions.
+    The failure of an Argument rule.
+
+    The exception describing the failure, and so its message,
+    are only built when they are read, except for a Validator
+    whose exception is kept when its check fails.
 
     Attributes
-    __________
-    values: dict
-        The provided arguments values validated and correctly formatted.
+    ----------
+    argument : Argument
+        The Argument whose rule failed.
+    code : str
+        The rule that failed: 'type', 'required', 'choices'
+        or 'validator'.
+    value : Any
+        The value that failed the rule.
+    validator : Validator | None
+        The Validator that failed, for the 'validator' code.
+    name : str
+        The name of the Argument.
+    exception : Exception
+        The exception fail-fast validation raises for this failure.
+    message : str
+        The message of the failure.
+    """
+    __slots__ = ('argument', 'code', 'value', 'validator', '__exception')
+
+    def __init__(
+            self,
+            argument: Argument,
+            code: str,
+            value: Any,
+            exception: Exception | None = None,
+            validator: Validator | None = None
+    ) -> None:
+        self.argument: Argument = argument
+        self.code: str = code
+        self.value: Any = value
+        self.validator: Validator | None = validator
+        self.__exception: Exception | None = exception
+
+    def __repr__(self) -> str:
+        return f'ArgumentError({self.name!r}, {self.code!r})'
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the Argument.
+        <hr />
+        """
+        return self.argument.name
+
+    @property
+    def exception(self) -> Exception:
+        """
+        The exception fail-fast validation raises for this failure.
+        <hr />
+        """
+        if self.__exception is None:
+            if self.code == 'type':
+                self.__exception = self.argument._type_error(self.value)
+            elif self.code == 'required':
+                self.__exception = self.argument._required_error()
+            elif self.code == 'choices':
+                self.__exception = self.argument._choices_error(self.value)
+            else:
+                self.__exception = ValueError(
+                    f'Option {self.name}: {self.value} is not valid.'
+                )
+        return self.__exception
+
+    @property
+    def message(self) -> str:
+        """
+        The message of the failure.
+        <hr />
+        """
+        return str(self.exception)
+
+
+class ArgumentErrors(ValueError):
+    """
+    The failures of all the Arguments, collected in a single pass.
+
+    A sequence of [ArgumentError][arganic.arguments.ArgumentError],
+    empty (and so false) when all the values are valid. Its message
+    is only formatted when it is rendered.
 
     Methods
     -------
-    get(key)
-        Retrieves the value of a specified argument or property.
-
-    set(key, value)
-        Sets the value of a specified argument or property.
+    to_list()
+        The failures as a list of dictionaries.
     """
-    __arguments: dict[str, dict[str, Argument]] = {}
+    def __init__(self, errors: Iterable[ArgumentError] = ()) -> None:
+        super().__init__()
+        self.errors: tuple[ArgumentError, ...] = tuple(errors)
 
-    @staticmethod
-    def set_arguments(decorated: type, arguments: dict[str, Argument]):
-        if not ArgumentHandler.__has_arguments(decorated):
-            for key, value in arguments.items():
-                value._name = key
-            decorated_id = ArgumentHandler.__get_decorated_id(decorated)
-            ArgumentHandler.__arguments[decorated_id] = arguments
+    def __len__(self) -> int:
+        return len(self.errors)
 
-    @staticmethod
-    def __has_arguments(decorated: type) -> bool:
-        decorated_id = ArgumentHandler.__get_decorated_id(decorated)
-        return ArgumentHandler.__arguments.get(decorated_id) is not None
+    def __iter__(self) -> Iterator[ArgumentError]:
+        return iter(self.errors)
 
-    @staticmethod
-    def __get_decorated_id(decorated: type | Callable) -> str:
-        return '.'.join(
-            [decorated.__module__, decorated.__qualname__]
-        )
+    def __getitem__(self, index: int) -> ArgumentError:
+        return self.errors[index]
 
-    def __init__(self, decorated: type | Callable, *args, **kwargs) -> None:
-        self.__values: dict = args[0] if args else kwargs
-        self.__decorated: str = ArgumentHandler.__get_decorated_id(decorated)
-        self.__validate()
+    def __str__(self) -> str:
+        return '\n'.join(error.message for error in self.errors)
 
-    def __get_argument(self, name: str) -> Argument:
-        prop = ArgumentHandler.__arguments.get(
-            self.__decorated).get(name)
-        if prop:
-            return prop
-        raise KeyError(
-            f'The property {name} not exists for {self.__decorated}.'
+    def to_list(self) -> list[dict[str, str]]:
+        """
+        The failures as a list of dictionaries.
+
+        Returns
+        -------
+        list[dict[str, str]]
+            The name, code and message of each failure.
+        """
+        return [
+            {'name': error.name, 'code': error.code, 'message': error.message}
+            for error in self.errors
+        ]
+
+
+class ArgumentValues(dict):
+    """
+    The validated values of a handler, a read-only dict.
+
+    Being a dict, the values can be serialized with json.dumps,
+    copied with copy.deepcopy or pickled, the copies being read-only
+    too. Changing a value raises a TypeError.
+    """
+    __slots__ = ()
+
+    def __readonly(self, *args, **kwargs) -> None:
+        raise TypeError(
+            f'{type(self).__name__} object does not support item assignment'
         )
 
-    @property
-    def values(self) -> dict:
+    __setitem__ = __delitem__ = __ior__ = __readonly
+    clear = pop = popitem = setdefault = update = __readonly
+
+    def __reduce__(self) -> tuple:
+        return type(self), (dict(self),)
+
+
+class Sampler:
+    """
+    Decides which calls run the validation of the values.
+
+    A fraction of the calls, and the first calls of each time window,
+    run the full validation: the others only apply the defaults. With a
+    rate, the first call is sampled and `ceil(calls * rate)` of the
+    calls are, counted with integers so the rate does not drift.
+    The violations found in the sampled calls are counted by decorated
+    object and reported to an optional callback.
+
+    Attributes
+    ----------
+    rate : float
+        The fraction of the calls validated, between 0 and 1.
+    first : int
+        The number of calls validated at the start of each window.
+    window : float
+        The duration of a window, in seconds.
+    raises : bool
+        Whether a violation raises, or is only counted and reported.
+
+    Methods
+    -------
+    sample()
+        Whether the call in progress has to be validated.
+
+    validate(schema, values)
+        Validates the values of a call, when it is sampled.
+
+    stats()
+        The counters of the sampler.
+    """
+    __slots__ = (
+        'rate',
+        'first',
+        'window',
+        'raises',
+        '__report',
+        '__lock',
+        '__numerator',
+        '__denominator',
+        '__window_start',
+        '__window_count',
+        '__calls',
+        '__sampled',
+        '__violations',
+    )
+
+    def __init__(
+            self,
+            rate: float = 0.0,
+            first: int = 0,
+            window: float = 1.0,
+            raises: bool = True,
+            report: Callable[[str, Exception], Any] | None = None
+    ) -> None:
         """
-        The validated values.
-        <hr />
+        Sampler constructor.
+
+        Parameters
+        ----------
+        rate: float, default=0.0
+            The fraction of the calls validated, between 0 and 1.
+        first: int, default=0
+            The number of calls validated at the start of each window.
+        window: float, default=1.0
+            The duration of a window, in seconds.
+        raises: bool, default=True
+            Whether a violation raises, or is only counted and reported.
+        report: Callable[[str, Exception], Any] | None, default=None
+            Called with the name of the decorated object and the
+            exception of each violation.
+
+        Raises
+        ------
+        ValueError
+            If the rate is not between 0 and 1.
         """
-        props = ArgumentHandler.__arguments.get(self.__decorated)
-        values = {}
-        for key, prop in props.items():
-            values[key] = self.get(key)
-        return values
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f'The sampling rate {rate} is not in [0, 1].')
+        self.rate: float = rate
+        self.first: int = first
+        self.window: float = window
+        self.raises: bool = raises
+        self.__report: Callable[[str, Exception], Any] | None = report
+        self.__lock: threading.Lock = threading.Lock()
+        fraction = Fraction(rate).limit_denominator()
+        self.__numerator: int = fraction.numerator
+        self.__denominator: int = fraction.denominator
+        self.__window_start: float = time.monotonic()
+        self.__window_count: int = 0
+        self.__calls: int = 0
+        self.__sampled: int = 0
+        self.__violations: dict[str, int] = {}
 
-    def get(self, key: str) -> Any:
+    def sample(self) -> bool:
         """
-        Retrieves the value of a specified argument or property.
+        Whether the call in progress has to be validated.
+
+        Returns
+        -------
+        bool
+            True if the call is sampled.
+        """
+        with self.__lock:
+            self.__calls += 1
+            if self.first:
+                now = time.monotonic()
+                if now - self.__window_start >= self.window:
+                    self.__window_start = now
+                    self.__window_count = 0
+                if self.__window_count < self.first:
+                    self.__window_count += 1
+                    self.__sampled += 1
+                    return True
+            numerator = self.__numerator
+            denominator = self.__denominator
+            if (
+                    -(-self.__calls * numerator // denominator)
+                    > -(-(self.__calls - 1) * numerator // denominator)
+            ):
+                self.__sampled += 1
+                return True
+            return False
+
+    def validate(self, schema: 'ArgumentSchema', values: dict) -> bool:
+        """
+        Validates the values of a call, when it is sampled.
 
         Parameters
         ----------
-        key : str
-            The key of the argument or property to retrieve.
+        schema : ArgumentSchema
+            The schema of the decorated object.
+        values : dict
+            The values of the call.
 
         Returns
         -------
-        Any
-            The value of the argument or property.
+        bool
+            False if a violation was found and not raised.
         """
-        return self.__values.get(
-            key,
-            self.__get_argument(key).default
-        )
+        if not self.sample():
+            return True
+        try:
+            return schema.validate(values)
+        except Exception as error:
+            self.__violation(schema, error)
+        return False
 
-    def set(self, key: str, value: Any) -> None:
+    async def validate_async(
+            self,
+            schema: 'ArgumentSchema',
+            values: dict
+    ) -> bool:
         """
-        Sets the value of arguments or properties to the specified key.
+        Validates the values of a call when it is sampled, awaiting
+        the AsyncValidators of all the arguments concurrently.
 
         Parameters
         ----------
-        key : str
-            The key of the argument to set.
-        value : Any
-            The new value for the argument.
+        schema : ArgumentSchema
+            The schema of the decorated object.
+        values : dict
+            The values of the call.
 
-        Raises
+        Returns
         -------
-        ValueError
-            if the argument is not writeable.
+        bool
+            False if a violation was found and not raised.
         """
-        if self.__get_argument(key).read_only:
-            raise ValueError(
-                f'The argument {key} is read-only in {self.__decorated}.'
+        if not self.sample():
+            return True
+        try:
+            return await schema.validate_async(values)
+        except Exception as error:
+            self.__violation(schema, error)
+        return False
+
+    def __violation(self, schema: 'ArgumentSchema', error: Exception) -> None:
+        with self.__lock:
+            self.__violations[schema.name] = (
+                self.__violations.get(schema.name, 0) + 1
             )
-        if self.__get_argument(key).validate(value):
-            self.__values[key] = value
+        if self.__report is not None:
+            self.__report(schema.name, error)
+        if self.raises:
+            raise error
 
-    def __validate(self) -> bool:
-        props = ArgumentHandler.__arguments.get(self.__decorated)
-        for key, prop in props.items():
-            prop.validate(self.get(key))
-        return True
+    def stats(self) -> dict[str, Any]:
+        """
+        The counters of the sampler.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number of `calls`, of `sampled` calls, of `violations`,
+            and the violations by decorated object name in `targets`.
+        """
+        with self.__lock:
+            return {
+                'calls': self.__calls,
+                'sampled': self.__sampled,
+                'violations': sum(self.__violations.values()),
+                'targets': dict(self.__violations),
+            }
 
 
-def class_properties(**_properties: Argument) -> Callable:
+class ArgumentSchema:
     """
-    Decorator for class properties.
+    The compiled form of a set of Arguments.
 
-    A decorator for class properties allowing you to define the data
-    managed by the class during construction and then access these
-    values within the class.
+    Built once, when a decorator is applied, it names each
+    [Argument][arganic.arguments.Argument] and flattens all
+    of their rules into a single validation plan.
 
-    Parameters
+    Attributes
     ----------
-    _properties
-        A dictionary of the [Arguments][arganic.arguments.Argument]
-        the decorator will handle.
-
-    Returns
-    -------
-    Callable
-        The decorator function.
+    arguments : dict[str, Argument]
+        The Arguments indexed by name.
+    name : str
+        The identifier of the decorated object, used in error messages.
+    defaults : dict[str, Any]
+        The default value of each Argument.
+    plan : tuple[tuple[str, Any, Callable]]
+        One (name, default, check) entry per rule to check,
+        arguments without any rule do not appear in the plan.
+    async_plan : tuple[tuple[str, Any, Callable]]
+        The plan of async calls, without the AsyncValidators.
+    awaitables : tuple[tuple[str, Any, AsyncValidator]]
+        One (name, default, validator) entry per AsyncValidator.
+    collect_errors : bool
+        Whether validation collects the failures of all the Arguments
+        into an ArgumentErrors, instead of raising the first one.
+    positional : tuple[str, ...]
+        The names positional values are bound to, in order.
+    validation : bool
+        Whether the values are validated, when False the plans are
+        empty and only the defaults are applied.
+    sampler : Sampler | None
+        The sampler deciding which calls are validated, all of them
+        when None.
     """
-    def properties_decorator(decorated_class) -> Type:
-        class ClassProperties(decorated_class):
-            def __init__(self, *args, **kwargs) -> None:
-                ArgumentHandler.set_arguments(decorated_class, _properties)
-                super().__init__(decorated_class, *args, **kwargs)
-        return ClassProperties
-    return properties_decorator
+    __slots__ = (
+        'arguments',
+        'name',
+        'defaults',
+        'plan',
+        'async_plan',
+        'awaitables',
+        'collect_errors',
+        'positional',
+        'validation',
+        'sampler',
+        '__dict_first',
+        '__rules',
+        '__async_rules',
+        '__tests',
+        '__async_tests',
+        '__looped',
+    )
+
+    def __init__(
+            self,
+            arguments: dict[str, Argument],
+            name: str = '',
+            collect_errors: bool = False,
+            validation: bool = True,
+            sampling: float | Sampler | None = None
+    ) -> None:
+        for key, argument in arguments.items():
+            argument._name = key
+        self.arguments: dict[str, Argument] = arguments
+        self.name: str = name
+        self.validation: bool = validation
+        if sampling is not None and not isinstance(sampling, Sampler):
+            sampling = Sampler(rate=sampling)
+        self.sampler: Sampler | None = sampling
+        self.collect_errors: bool = collect_errors and validation
+        self.defaults: dict[str, Any] = {
+            key: argument.default for key, argument in arguments.items()
+        }
+        validated = arguments if validation else {}
+        self.plan: tuple[tuple[str, Any, Callable], ...] = tuple(
+            (key, argument.default, check)
+            for key, argument in validated.items()
+            for check in argument._compile()
+        )
+        self.async_plan: tuple[tuple[str, Any, Callable], ...] = tuple(
+            (key, argument.default, check)
+            for key, argument in validated.items()
+            for check in argument._compile(asynchronous=True)
+        )
+        self.awaitables: tuple[tuple[str, Any, AsyncValidator], ...] = tuple(
+            (key, argument.default, validator)
+            for key, argument in validated.items()
+            for validator in argument._validators
+            if isinstance(validator, AsyncValidator)
+        )
+        self.__rules: tuple[tuple[str, Any, tuple[Callable, ...]], ...] = (
+            tuple(
+                (key, argument.default, self.__error_checks(argument))
+                for key, argument in arguments.items()
+            )
+        )
+        self.__async_rules: tuple[
+            tuple[str, Any, tuple[Callable, ...]], ...
+        ] = tuple(
+            (key, argument.default, self.__error_checks(argument, True))
+            for key, argument in arguments.items()
+        )
+        self.__tests: tuple[tuple[str, Any, tuple[Callable, ...]], ...] = (
+            tuple(
+                (key, argument.default,
+                 self.__error_checks(argument, exceptions=False))
+                for key, argument in arguments.items()
+            )
+        )
+        self.__async_tests: tuple[
+            tuple[str, Any, tuple[Callable, ...]], ...
+        ] = tuple(
+            (key, argument.default,
+             self.__error_checks(argument, True, exceptions=False))
+            for key, argument in arguments.items()
+        )
+        self.__looped: bool = any(
+            isinstance(validator, AsyncValidator)
+            and type(validator).validate is AsyncValidator.validate
+            for argument in arguments.values()
+            for validator in argument._validators
+        )
+        self.positional: tuple[str, ...] = ()
+        self.__dict_first: bool = False
+        self.bind_positional(tuple(arguments))
 
+    def bind_positional(self, names: tuple[str, ...]) -> None:
+        """
+        Sets the names positional values are bound to.
 
-def method_arguments(**_arguments: Argument) -> Callable:
-    """
-    Decorator for method arguments.
+        Parameters
+        ----------
+        names : tuple[str, ...]
+            The names, in order.
+        """
+        self.positional = names
+        first = self.arguments.get(names[0]) if names else None
+        types = first.type if first is not None else Any
+        if not isinstance(types, tuple):
+            types = (types,)
+        self.__dict_first = any(
+            arg_type is not Any and issubclass(dict, arg_type)
+            for arg_type in types
+        )
 
-    A decorator for class methods allowing you to constrain the arguments
-    provided during the call but also to find the correctly formatted
-    values within the method.
+    def bind_signature(self, decorated: Callable, skip: int = 0) -> None:
+        """
+        Binds positional values after the signature of the decorated
+        method or function, once, when the decorator is applied.
 
-    Parameters
-    ----------
-    _arguments
-        A dictionary of the [Arguments][arganic.arguments.Argument]
-        the decorator will handle.
+        Named positional parameters are bound by name. When there
+        are none, a `*args` parameter binds positional values to the
+        Arguments, in the order they are declared.
 
-    Returns
-    -------
-    Callable
-        The decorator function.
-    """
-    def arguments_decorator(decorated_func) -> Callable:
-        def method(instance, *args, **kwargs):
-            ArgumentHandler.set_arguments(decorated_func, _arguments)
-            method.arguments = ArgumentHandler(decorated_func, *args, **kwargs)
-            return decorated_func(instance, *args, **kwargs)
-        return method
-    return arguments_decorator
+        Parameters
+        ----------
+        decorated : Callable
+            The decorated method or function.
+        skip : int, default=0
+            The number of leading parameters not to bind, such as self.
+        """
+        try:
+            parameters = tuple(
+                inspect.signature(decorated).parameters.values()
+            )[skip:]
+        except (TypeError, ValueError):
+            return
+        named = tuple(
+            parameter.name for parameter in parameters
+            if parameter.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD
+            )
+        )
+        if named or not any(
+                parameter.kind is inspect.Parameter.VAR_POSITIONAL
+                for parameter in parameters
+        ):
+            self.bind_positional(named)
 
+    def bind(self, args: tuple, kwargs: dict) -> dict:
+        """
+        Maps the values of a call to the argument names.
 
-def function_arguments(**_arguments: Argument) -> Callable:
-    """
-    Decorator for function arguments.
+        A single dict positional value holds the values by name,
+        unless the first positional Argument accepts dicts.
 
-    A decorator for functions allowing you to constrain the arguments
-    provided during the call but also to find the correctly formatted values
-    within the function.
+        Parameters
+        ----------
+        args : tuple
+            The positional values.
+        kwargs : dict
+            The keyword values.
 
-    Parameters
-    ----------
-    _arguments
-        A dictionary of the [Arguments][arganic.arguments.Argument]
-        the decorator will handle.
+        Returns
+        -------
+        dict
+            The values by name.
 
-    Returns
-    -------
-    Callable
-        The decorator function.
-    """
-    def arguments_decorator(decorated_func) -> Callable:
-        def function(*args, **kwargs):
-            ArgumentHandler.set_arguments(decorated_func, _arguments)
-            function.arguments = ArgumentHandler(
-                decorated_func,
-                *args,
-                **kwargs
-            )
-            return decorated_func(*args, **kwargs)
-        return function
-    return arguments_decorator
+        Raises
+        ------
+        TypeError
+            If a value is given both by position and by name.
+        """
+        if not args:
+            return kwargs
+        if (
+                len(args) == 1
+                and isinstance(args[0], dict)
+                and not self.__dict_first
+        ):
+            return args[0] | kwargs if kwargs else args[0]
+        values = dict(zip(self.positional, args))
+        for key in kwargs:
+            if key in values:
+                raise TypeError(
+                    f'{self.name} got multiple values for argument {key}.'
+                )
+        values.update(kwargs)
+        return values
+
+    def validate(self, values: dict) -> bool:
+        """
+        Run the validation plan against the provided values.
+
+        Parameters
+        ----------
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        bool
+            True if all the values are valid.
+
+        Raises
+        ------
+        ArgumentErrors
+            In collect errors mode, if any value is invalid.
+        """
+        if profiling.PROFILER is not None:
+            return profiling.PROFILER.validate(self, values)
+        if self.collect_errors:
+            errors = self.collect(values)
+            if errors:
+                raise errors
+            return True
+        for key, default, check in self.plan:
+            check(values.get(key, default))
+        return True
+
+    def is_valid(self, values: dict) -> bool:
+        """
+        Check the provided values without raising nor building
+        any exception.
+
+        Parameters
+        ----------
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        bool
+            True if all the values are valid, False otherwise.
+
+        Raises
+        ------
+        RuntimeError
+            If the Arguments have AsyncValidators without a sync
+            validation and an event loop is running, await
+            is_valid_async() instead.
+        """
+        if self.__looped:
+            return self.__run(
+                'is_valid', lambda: self.is_valid_async(values)
+            )
+        for key, default, checks in self.__tests:
+            value = values.get(key, default)
+            for check in checks:
+                if check(value) is not None:
+                    return False
+        return True
+
+    async def is_valid_async(self, values: dict) -> bool:
+        """
+        Check the provided values without raising, awaiting the
+        AsyncValidators of all the arguments concurrently.
+
+        Parameters
+        ----------
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        bool
+            True if all the values are valid, False otherwise.
+        """
+        for key, default, checks in self.__async_tests:
+            value = values.get(key, default)
+            for check in checks:
+                if check(value) is not None:
+                    return False
+        results = await asyncio.gather(*(
+            validator.is_valid_async(value)
+            for key, default, validator in self.awaitables
+            if (value := values.get(key, default)) is not None
+        ))
+        return all(results)
+
+    def __run(
+            self,
+            name: str,
+            coroutine: Callable[[], Awaitable]
+    ) -> Any:
+        self.__check_no_loop(name)
+        return asyncio.run(coroutine())
+
+    def __check_no_loop(self, name: str) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise RuntimeError(
+            f'{self.name} has AsyncValidators without a sync validation: '
+            f'await {name}_async() from a running event loop.'
+        )
+
+    def collect(self, values: dict) -> ArgumentErrors:
+        """
+        Run every rule of every Argument and collect the failures,
+        without raising.
+
+        The rules of an Argument stop at its first failure, the
+        following Arguments are checked all the same.
+
+        Parameters
+        ----------
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        ArgumentErrors
+            The failures, empty if all the values are valid.
+
+        Raises
+        ------
+        RuntimeError
+            If the Arguments have AsyncValidators without a sync
+            validation and an event loop is running, await
+            collect_async() instead.
+        """
+        if self.__looped:
+            return self.__run('collect', lambda: self.collect_async(values))
+        return ArgumentErrors(self.__collect(self.__rules, values))
+
+    @staticmethod
+    def __collect(
+            rules: tuple[tuple[str, Any, tuple[Callable, ...]], ...],
+            values: dict
+    ) -> list[ArgumentError]:
+        errors = []
+        for key, default, checks in rules:
+            value = values.get(key, default)
+            for check in checks:
+                error = check(value)
+                if error is not None:
+                    errors.append(error)
+                    break
+        return errors
+
+    async def validate_async(self, values: dict) -> bool:
+        """
+        Run the validation plan against the provided values, awaiting
+        the AsyncValidators of all the arguments concurrently.
+
+        Parameters
+        ----------
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        bool
+            True if all the values are valid.
+
+        Raises
+        ------
+        ArgumentErrors
+            In collect errors mode, if any value is invalid.
+        """
+        if profiling.PROFILER is not None:
+            return await profiling.PROFILER.validate_async(self, values)
+        if self.collect_errors:
+            errors = await self.collect_async(values)
+            if errors:
+                raise errors
+            return True
+        for key, default, check in self.async_plan:
+            check(values.get(key, default))
+        awaiting = []
+        for key, default, validator in self.awaitables:
+            value = values.get(key, default)
+            if value is not None:
+                awaiting.append(validator.validate_async(value))
+        if awaiting:
+            await asyncio.gather(*awaiting)
+        return True
+
+    async def collect_async(self, values: dict) -> ArgumentErrors:
+        """
+        Run every rule of every Argument and collect the failures,
+        awaiting the AsyncValidators concurrently, without raising.
+
+        Parameters
+        ----------
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        ArgumentErrors
+            The failures, empty if all the values are valid.
+        """
+        errors = self.__collect(self.__async_rules, values)
+        failed = {error.argument for error in errors}
+        awaited = []
+        awaiting = []
+        for key, default, validator in self.awaitables:
+            value = values.get(key, default)
+            if value is not None and self.arguments[key] not in failed:
+                awaited.append((self.arguments[key], value, validator))
+                awaiting.append(validator.validate_async(value))
+        results = await asyncio.gather(*awaiting, return_exceptions=True)
+        for (argument, value, validator), result in zip(awaited, results):
+            if isinstance(result, Exception) and argument not in failed:
+                failed.add(argument)
+                errors.append(ArgumentError(
+                    argument, 'validator', value, result, validator
+                ))
+        return ArgumentErrors(errors)
+
+    def validate_many(self, records: Iterable[dict]) -> list[dict | Exception]:
+        """
+        Validate many records at once, column by column.
+
+        Each rule of an Argument is checked in a single pass over the
+        column of its values, choices are looked up in a set.
+        A record failing a rule is left out of the next passes, so the
+        error reported for a record is the one validate() would raise.
+
+        Parameters
+        ----------
+        records : Iterable[dict]
+            The records to validate.
+
+        Returns
+        -------
+        list[dict | Exception]
+            For each record, in order, the validated values or
+            the exception raised by the first failing rule.
+
+        Raises
+        ------
+        RuntimeError
+            If the Arguments have AsyncValidators without a sync
+            validation and an event loop is running, await
+            validate_many_async() instead.
+        """
+        rows = list(records)
+        if self.__looped:
+            return self.__run(
+                'validate_many', lambda: self.validate_many_async(rows)
+            )
+        return self.__results(rows, self.__check_rows(self.__rules, rows))
+
+    async def validate_many_async(
+            self,
+            records: Iterable[dict]
+    ) -> list[dict | Exception]:
+        """
+        Validate many records at once, awaiting the AsyncValidators
+        of all the records concurrently.
+
+        Parameters
+        ----------
+        records : Iterable[dict]
+            The records to validate.
+
+        Returns
+        -------
+        list[dict | Exception]
+            For each record, in order, the validated values or
+            the exception raised by the first failing rule.
+        """
+        rows = list(records)
+        errors = self.__check_rows(self.__async_rules, rows)
+        awaited = []
+        awaiting = []
+        for index, row in enumerate(rows):
+            if errors[index] is not None:
+                continue
+            for key, default, validator in self.awaitables:
+                value = row.get(key, default)
+                if value is not None:
+                    awaited.append(index)
+                    awaiting.append(validator.validate_async(value))
+        results = await asyncio.gather(*awaiting, return_exceptions=True)
+        for index, result in zip(awaited, results):
+            if isinstance(result, Exception) and errors[index] is None:
+                errors[index] = result
+        return self.__results(rows, errors)
+
+    @staticmethod
+    def __check_rows(
+            rules: tuple[tuple[str, Any, tuple[Callable, ...]], ...],
+            rows: list[dict]
+    ) -> list[Exception | None]:
+        errors: list[Exception | None] = [None] * len(rows)
+        for key, default, checks in rules:
+            column = [
+                (index, row.get(key, default))
+                for index, row in enumerate(rows)
+                if errors[index] is None
+            ]
+            for check in checks:
+                failed = False
+                for index, value in column:
+                    error = check(value)
+                    if error is not None:
+                        errors[index] = error.exception
+                        failed = True
+                if failed:
+                    column = [
+                        (index, value) for index, value in column
+                        if errors[index] is None
+                    ]
+        return errors
+
+    def __results(
+            self,
+            rows: list[dict],
+            errors: list[Exception | None]
+    ) -> list[dict | Exception]:
+        defaults = self.defaults.items()
+        return [
+            errors[index] if errors[index] is not None else {
+                key: row.get(key, default) for key, default in defaults
+            }
+            for index, row in enumerate(rows)
+        ]
+
+    def iter_validate(
+            self,
+            records: Iterable[dict]
+    ) -> Iterator[dict | Exception]:
+        """
+        Validate records one at a time, lazily.
+
+        A record is only read from the iterable when the previous
+        result has been consumed, so unbounded streams are validated
+        in constant memory. Errors are returned, not raised.
+
+        Parameters
+        ----------
+        records : Iterable[dict]
+            The records to validate.
+
+        Yields
+        ------
+        dict | Exception
+            For each record, in order, the validated values or
+            the exception of the first failing rule.
+        """
+        if self.__looped:
+            self.__check_no_loop('iter_validate')
+            with asyncio.Runner() as runner:
+                for record in records:
+                    yield runner.run(self.__validate_record_async(record))
+            return
+        checks = self.__flat_checks(self.__rules)
+        defaults = self.defaults.items()
+        for record in records:
+            for key, default, check in checks:
+                error = check(record.get(key, default))
+                if error is not None:
+                    yield error.exception
+                    break
+            else:
+                yield {
+                    key: record.get(key, default)
+                    for key, default in defaults
+                }
+
+    async def iter_validate_async(
+            self,
+            records: Iterable[dict] | AsyncIterable[dict]
+    ) -> AsyncIterator[dict | Exception]:
+        """
+        Validate records one at a time, lazily, awaiting the
+        AsyncValidators of each record concurrently.
+
+        Parameters
+        ----------
+        records : Iterable[dict] | AsyncIterable[dict]
+            The records to validate.
+
+        Yields
+        ------
+        dict | Exception
+            For each record, in order, the validated values or
+            the exception of the first failing rule.
+        """
+        if isinstance(records, AsyncIterable):
+            async for record in records:
+                yield await self.__validate_record_async(record)
+        else:
+            for record in records:
+                yield await self.__validate_record_async(record)
+
+    async def __validate_record_async(
+            self,
+            record: dict
+    ) -> dict | Exception:
+        for key, default, check in self.__flat_checks(self.__async_rules):
+            error = check(record.get(key, default))
+            if error is not None:
+                return error.exception
+        results = await asyncio.gather(*(
+            validator.validate_async(value)
+            for key, default, validator in self.awaitables
+            if (value := record.get(key, default)) is not None
+        ), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                return result
+        return {
+            key: record.get(key, default)
+            for key, default in self.defaults.items()
+        }
+
+    @staticmethod
+    def __flat_checks(
+            rules: tuple[tuple[str, Any, tuple[Callable, ...]], ...]
+    ) -> tuple[tuple[str, Any, Callable], ...]:
+        return tuple(
+            (key, default, check)
+            for key, default, rule_checks in rules
+            for check in rule_checks
+        )
+
+    @staticmethod
+    def __error_checks(
+            argument: Argument,
+            asynchronous: bool = False,
+            exceptions: bool = True
+    ) -> tuple[Callable[[Any], ArgumentError | None], ...]:
+        arg_type = argument.type
+        choices = argument.choices
+        required = argument.required
+        checks = []
+        if arg_type is not Any:
+            def check_type(value: Any) -> ArgumentError | None:
+                if value is not None and not isinstance(value, arg_type):
+                    return ArgumentError(argument, 'type', value)
+            checks.append(check_type)
+        if required and argument.default is None:
+            def check_required(value: Any) -> ArgumentError | None:
+                if not value and value is not False:
+                    return ArgumentError(argument, 'required', value)
+            checks.append(check_required)
+        if choices:
+            in_choices = argument._in_choices
+
+            def check_choices(value: Any) -> ArgumentError | None:
+                if (required or value is not None) and not in_choices(value):
+                    return ArgumentError(argument, 'choices', value)
+            checks.append(check_choices)
+        for validator in argument._validators:
+            if asynchronous and isinstance(validator, AsyncValidator):
+                continue
+            if not exceptions:
+                def check_validator(
+                        value: Any,
+                        validator: Validator = validator
+                ) -> ArgumentError | None:
+                    if value is not None and not validator.is_valid(value):
+                        return ArgumentError(
+                            argument, 'validator', value, validator=validator
+                        )
+                checks.append(check_validator)
+                continue
+
+            def check_validator(
+                    value: Any,
+                    validator: Validator = validator
+            ) -> ArgumentError | None:
+                if value is None:
+                    return None
+                try:
+                    validator.validate(value)
+                except Exception as error:
+                    return ArgumentError(
+                        argument, 'validator', value, error, validator
+                    )
+            checks.append(check_validator)
+        return tuple(checks)
+
+
+class ArgumentHandler:
+    """
+    Handles arguments or properties for decorated classes,
+    methods or functions.
+
+    Attributes
+    __________
+    values: ArgumentValues
+        The provided arguments values validated and correctly formatted.
+
+    Methods
+    -------
+    get(key)
+        Retrieves the value of a specified argument or property.
+
+    set(key, value)
+        Sets the value of a specified argument or property.
+
+    construct(*args, **kwargs)
+        Creates an instance from trusted values, without validation.
+
+    Notes
+    -----
+    ArgumentHandler uses `__slots__`: declare `__slots__ = ()` in
+    decorated classes that need no other attributes, to keep
+    their instances free of a `__dict__`.
+    """
+    __slots__ = ('__values', '__schema', '__snapshot')
+
+    __registry: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def set_arguments(
+            decorated: type | Callable,
+            arguments: ArgumentSchema | dict[str, Argument]
+    ) -> ArgumentSchema:
+        """
+        Registers the arguments handled for a decorated class,
+        method or function.
+
+        The registration is done once, when the decorator is applied.
+        The schema is stored on the decorated object itself, in its
+        `__arganic_schema__` attribute, or for objects without
+        attributes in a registry holding them by weak reference:
+        each object has its own schema, and the schema goes away
+        with it.
+
+        Parameters
+        ----------
+        decorated : type | Callable
+            The decorated class, method or function.
+        arguments : ArgumentSchema | dict[str, Argument]
+            The Arguments handled for the decorated object.
+
+        Returns
+        -------
+        ArgumentSchema
+            The registered schema.
+        """
+        if not isinstance(arguments, ArgumentSchema):
+            arguments = ArgumentSchema(arguments)
+        if not arguments.name:
+            arguments.name = ArgumentHandler.__get_decorated_id(decorated)
+        try:
+            decorated.__arganic_schema__ = arguments
+        except (AttributeError, TypeError):
+            ArgumentHandler.__registry[decorated] = arguments
+        return arguments
+
+    @staticmethod
+    def get_schema(
+            decorated: ArgumentSchema | type | Callable
+    ) -> ArgumentSchema:
+        """
+        Retrieves the arguments registered for a decorated class,
+        method or function.
+
+        A class which is not decorated itself gets the schema of its
+        nearest decorated base class.
+
+        Parameters
+        ----------
+        decorated : ArgumentSchema | type | Callable
+            The decorated class, method or function.
+
+        Returns
+        -------
+        ArgumentSchema
+            The registered schema.
+
+        Raises
+        ------
+        KeyError
+            If no arguments are registered for the decorated object.
+        """
+        if isinstance(decorated, ArgumentSchema):
+            return decorated
+        schema = getattr(decorated, '__arganic_schema__', None)
+        if schema is None:
+            try:
+                schema = ArgumentHandler.__registry.get(decorated)
+            except TypeError:
+                schema = None
+        if schema is None:
+            raise KeyError(
+                f'No arguments registered for '
+                f'{ArgumentHandler.__get_decorated_id(decorated)}.'
+            )
+        return schema
+
+    @staticmethod
+    def __get_decorated_id(decorated: type | Callable) -> str:
+        return '.'.join([
+            getattr(decorated, '__module__', None) or '',
+            getattr(decorated, '__qualname__', type(decorated).__qualname__)
+        ])
+
+    def __init__(
+            self,
+            decorated: ArgumentSchema | type | Callable,
+            *args,
+            **kwargs
+    ) -> None:
+        self.__schema: ArgumentSchema = ArgumentHandler.get_schema(decorated)
+        self.__values: dict = self.__schema.defaults | (
+            self.__schema.bind(args, kwargs)
+        )
+        self.__snapshot: ArgumentValues | None = None
+        if self.__schema.validation:
+            self.__validate()
+
+    @staticmethod
+    async def create_async(
+            schema: ArgumentSchema,
+            *args,
+            **kwargs
+    ) -> 'ArgumentHandler':
+        """
+        Creates a handler, awaiting the AsyncValidators of
+        the arguments concurrently.
+
+        Parameters
+        ----------
+        schema : ArgumentSchema
+            The schema of the decorated method or function.
+
+        Returns
+        -------
+        ArgumentHandler
+            The handler of the validated values.
+        """
+        handler = ArgumentHandler.__new__(ArgumentHandler)
+        handler.__values = schema.defaults | schema.bind(args, kwargs)
+        handler.__schema = schema
+        handler.__snapshot = None
+        if schema.sampler is not None and schema.validation:
+            await schema.sampler.validate_async(schema, handler.__values)
+        elif schema.validation:
+            await schema.validate_async(handler.__values)
+        return handler
+
+    @staticmethod
+    def _create_trusted(
+            schema: ArgumentSchema,
+            values: dict
+    ) -> 'ArgumentHandler':
+        """
+        Creates a handler for values already validated by the caller.
+
+        Parameters
+        ----------
+        schema : ArgumentSchema
+            The schema of the decorated method or function.
+        values : dict
+            The validated values of all the arguments.
+
+        Returns
+        -------
+        ArgumentHandler
+            The handler of the values.
+        """
+        handler = ArgumentHandler.__new__(ArgumentHandler)
+        handler.__values = values
+        handler.__schema = schema
+        handler.__snapshot = None
+        return handler
+
+    @staticmethod
+    def _property(name: str) -> property:
+        """
+        A property reading and setting the value of an argument.
+
+        A plain property, rather than a custom descriptor, lets the
+        interpreter specialize the attribute reads.
+
+        Parameters
+        ----------
+        name : str
+            The name of the argument.
+
+        Returns
+        -------
+        property
+            The property, its setter behaves as set().
+        """
+        def get_value(handler: 'ArgumentHandler') -> Any:
+            return handler.__values[name]
+
+        def set_value(handler: 'ArgumentHandler', value: Any) -> None:
+            handler.set(name, value)
+        return property(get_value, set_value)
+
+    @classmethod
+    def construct(cls, *args, **kwargs) -> 'ArgumentHandler':
+        """
+        Creates an instance from trusted values, without validation.
+
+        Meant to rebuild instances from values validated earlier, such
+        as the rows of a cache or a database: the missing values take
+        their default value, the values are not validated and the
+        `__init__` of the class is not run.
+
+        Returns
+        -------
+        ArgumentHandler
+            The instance.
+
+        Raises
+        ------
+        KeyError
+            If the class is not decorated.
+        """
+        schema = ArgumentHandler.get_schema(cls)
+        handler = cls.__new__(cls)
+        handler.__schema = schema
+        handler.__values = schema.defaults | schema.bind(args, kwargs)
+        handler.__snapshot = None
+        return handler
+
+    @staticmethod
+    def _restore(cls: type, values: dict) -> 'ArgumentHandler':
+        """
+        Rebuilds a pickled or copied instance, without validation.
+
+        Parameters
+        ----------
+        cls : type
+            The decorated class.
+        values : dict
+            The validated values.
+
+        Returns
+        -------
+        ArgumentHandler
+            The instance.
+        """
+        handler = cls.__new__(cls)
+        handler.__schema = ArgumentHandler.get_schema(cls)
+        handler.__values = dict(values)
+        handler.__snapshot = None
+        return handler
+
+    def __reduce__(self) -> tuple:
+        return (
+            ArgumentHandler._restore,
+            (type(self), self.__values),
+            self.__getstate__()
+        )
+
+    def __getstate__(self) -> tuple[dict | None, dict] | None:
+        """
+        The attributes of the instance which are not argument values.
+
+        The values are pickled apart and the schema is looked up from
+        the class again when unpickling, so validated instances cross
+        process boundaries without being validated again.
+
+        Returns
+        -------
+        tuple[dict | None, dict] | None
+            The `__dict__` and the slots of the subclasses, None when
+            the instance has neither.
+        """
+        attributes = getattr(self, '__dict__', None) or None
+        slots = {}
+        for cls in type(self).__mro__:
+            if cls is ArgumentHandler:
+                break
+            names = cls.__dict__.get('__slots__', ())
+            for name in (names,) if isinstance(names, str) else names:
+                if name in ('__dict__', '__weakref__'):
+                    continue
+                if name.startswith('__') and not name.endswith('__'):
+                    name = f'_{cls.__name__.lstrip("_")}{name}'
+                if hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        if attributes is None and not slots:
+            return None
+        return attributes, slots
+
+    def __get_argument(self, name: str) -> Argument:
+        prop = self.__schema.arguments.get(name)
+        if prop:
+            return prop
+        raise KeyError(
+            f'The property {name} not exists for {self.__schema.name}.'
+        )
+
+    @property
+    def values(self) -> ArgumentValues:
+        """
+        The validated values.
+
+        A read-only dict, built on first access and reused
+        until set() changes a value.
+        <hr />
+        """
+        snapshot = self.__snapshot
+        if snapshot is None:
+            values = self.__values
+            snapshot = self.__snapshot = ArgumentValues(
+                (key, values[key]) for key in self.__schema.defaults
+            )
+        return snapshot
+
+    def get(self, key: str) -> Any:
+        """
+        Retrieves the value of a specified argument or property.
+
+        Parameters
+        ----------
+        key : str
+            The key of the argument or property to retrieve.
+
+        Returns
+        -------
+        Any
+            The value of the argument or property.
+        """
+        try:
+            return self.__values[key]
+        except KeyError:
+            raise KeyError(
+                f'The property {key} not exists for {self.__schema.name}.'
+            ) from None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Sets the value of arguments or properties to the specified key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the argument to set.
+        value : Any
+            The new value for the argument.
+
+        Raises
+        -------
+        ValueError
+            if the argument is not writeable.
+        """
+        argument = self.__get_argument(key)
+        if argument.read_only:
+            raise ValueError(
+                f'The argument {key} is read-only in {self.__schema.name}.'
+            )
+        if not self.__schema.validation or argument.validate(value):
+            self.__values[key] = value
+            self.__snapshot = None
+
+    def __validate(self) -> bool:
+        if self.__schema.sampler is not None:
+            return self.__schema.sampler.validate(
+                self.__schema, self.__values
+            )
+        return self.__schema.validate(self.__values)
+
+
+class ArgumentContext:
+    """
+    Gives access to the arguments of the call in progress of a
+    decorated method or function.
+
+    Each call runs with its own
+    [ArgumentHandler][arganic.arguments.ArgumentHandler] stored in a
+    context variable, so concurrent calls from threads or asyncio
+    tasks and recursive calls never see each other's values.
+
+    Attributes
+    ----------
+    current : ArgumentHandler
+        The handler of the call in progress.
+    values : ArgumentValues
+        The validated values of the call in progress.
+
+    Methods
+    -------
+    get(key)
+        Retrieves the value of an argument of the call in progress.
+
+    set(key, value)
+        Sets the value of an argument of the call in progress.
+
+    defer(schema, decorated_func, skip=0)
+        Wraps a method or function without validating its values.
+
+    iterate(handler, generator)
+        Runs a generator with the handler current while it runs.
+
+    iterate_async(create, generator)
+        Runs an async generator with the handler current while it runs.
+    """
+    __slots__ = ('__name', '__current')
+
+    def __init__(self, name: str) -> None:
+        self.__name: str = name
+        self.__current: ContextVar = ContextVar(name)
+
+    def enter(self, handler: 'ArgumentHandler') -> Token:
+        """
+        Makes the handler the current one, until exit() is called.
+
+        Parameters
+        ----------
+        handler : ArgumentHandler
+            The handler of the call starting.
+
+        Returns
+        -------
+        Token
+            The token to give back to exit().
+        """
+        return self.__current.set(handler)
+
+    def defer(
+            self,
+            schema: ArgumentSchema,
+            decorated_func: Callable,
+            skip: int = 0
+    ) -> Callable:
+        """
+        Wraps a method or function without validating its values:
+        the handler of each call is only built if the call reads it.
+
+        Used when validation is off, so calls which never read their
+        values neither bind them nor apply the defaults.
+
+        Parameters
+        ----------
+        schema : ArgumentSchema
+            The schema of the decorated method or function.
+        decorated_func : Callable
+            The decorated method or function.
+        skip : int, default=0
+            1 for a method, whose instance is not an argument.
+
+        Returns
+        -------
+        Callable
+            The wrapper.
+        """
+        current = self.__current
+        if skip:
+            @functools.wraps(decorated_func)
+            def wrapper(instance, *args, **kwargs):
+                token = current.set([schema, args, kwargs])
+                try:
+                    return decorated_func(instance, *args, **kwargs)
+                finally:
+                    current.reset(token)
+        else:
+            @functools.wraps(decorated_func)
+            def wrapper(*args, **kwargs):
+                token = current.set([schema, args, kwargs])
+                try:
+                    return decorated_func(*args, **kwargs)
+                finally:
+                    current.reset(token)
+        return wrapper
+
+    def exit(self, token: Token) -> None:
+        """
+        Restores the handler that was current before enter().
+
+        Parameters
+        ----------
+        token : Token
+            The token returned by enter().
+        """
+        self.__current.reset(token)
+
+    def iterate(
+            self,
+            handler: 'ArgumentHandler',
+            generator: Generator
+    ) -> Generator:
+        """
+        Runs a generator with the handler current while it runs.
+
+        Calling a generator function only creates the generator, its
+        body runs later, one step each time it is resumed: the handler
+        is made current around each step.
+
+        Parameters
+        ----------
+        handler : ArgumentHandler
+            The handler of the call.
+        generator : Generator
+            The generator created by the call.
+
+        Returns
+        -------
+        Generator
+            A generator yielding, receiving and returning the values
+            of the generator.
+        """
+        sent = None
+        thrown = None
+        while True:
+            token = self.enter(handler)
+            try:
+                if thrown is not None:
+                    value = generator.throw(thrown)
+                else:
+                    value = generator.send(sent)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.exit(token)
+            thrown = None
+            try:
+                sent = yield value
+            except GeneratorExit:
+                token = self.enter(handler)
+                try:
+                    generator.close()
+                finally:
+                    self.exit(token)
+                raise
+            except BaseException as error:
+                sent = None
+                thrown = error
+
+    async def iterate_async(
+            self,
+            create: Callable[[], Awaitable['ArgumentHandler']],
+            generator: AsyncGenerator
+    ) -> AsyncGenerator:
+        """
+        Runs an async generator with the handler current while it runs.
+
+        The handler is created, awaiting the AsyncValidators, when the
+        generator is first resumed, then made current around each step.
+
+        Parameters
+        ----------
+        create : Callable[[], Awaitable[ArgumentHandler]]
+            Creates the handler of the call.
+        generator : AsyncGenerator
+            The async generator created by the call.
+
+        Returns
+        -------
+        AsyncGenerator
+            An async generator yielding and receiving the values
+            of the generator.
+        """
+        try:
+            handler = await create()
+        except BaseException:
+            await generator.aclose()
+            raise
+        sent = None
+        thrown = None
+        while True:
+            token = self.enter(handler)
+            try:
+                if thrown is not None:
+                    value = await generator.athrow(thrown)
+                else:
+                    value = await generator.asend(sent)
+            except StopAsyncIteration:
+                return
+            finally:
+                self.exit(token)
+            thrown = None
+            try:
+                sent = yield value
+            except GeneratorExit:
+                token = self.enter(handler)
+                try:
+                    await generator.aclose()
+                finally:
+                    self.exit(token)
+                raise
+            except BaseException as error:
+                sent = None
+                thrown = error
+
+    @property
+    def current(self) -> 'ArgumentHandler':
+        """
+        The handler of the call in progress.
+        <hr />
+        """
+        try:
+            handler = self.__current.get()
+        except LookupError:
+            raise LookupError(
+                f'No call of {self.__name} in progress.'
+            ) from None
+        if type(handler) is list:
+            # A deferred call, see defer(): the handler replaces it once
+            # built, so the contexts copied from the call share it.
+            if len(handler) == 3:
+                schema, args, kwargs = handler
+                handler[:] = (ArgumentHandler(schema, *args, **kwargs),)
+            return handler[0]
+        return handler
+
+    @property
+    def values(self) -> ArgumentValues:
+        """
+        The validated values of the call in progress.
+        <hr />
+        """
+        return self.current.values
+
+    def get(self, key: str) -> Any:
+        """
+        Retrieves the value of an argument of the call in progress.
+
+        Parameters
+        ----------
+        key : str
+            The name of the argument to retrieve.
+
+        Returns
+        -------
+        Any
+            The value of the argument.
+        """
+        return self.current.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Sets the value of an argument of the call in progress.
+
+        Parameters
+        ----------
+        key : str
+            The name of the argument to set.
+        value : Any
+            The new value for the argument.
+        """
+        self.current.set(key, value)
+
+
+def _split_options(
+        arguments: dict[str, Any],
+        **options: Any
+) -> tuple[dict[str, Argument], dict[str, Any]]:
+    """
+    Separates the Arguments given to a decorator from its options.
+
+    Parameters
+    ----------
+    arguments : dict[str, Any]
+        The keywords given to the decorator.
+    options
+        The options the decorator supports, with their default value.
+
+    Returns
+    -------
+    tuple[dict[str, Argument], dict[str, Any]]
+        The Arguments and the options.
+
+    Raises
+    ------
+    TypeError
+        If a keyword is neither an Argument nor a supported option.
+    """
+    declared = {}
+    for key, value in arguments.items():
+        if isinstance(value, Argument):
+            declared[key] = value
+        elif key in options:
+            options[key] = value
+        else:
+            raise TypeError(
+                f'{key} is neither an Argument nor a decorator option.'
+            )
+    return declared, options
+
+
+def _generate_wrapper(
+        schema: ArgumentSchema,
+        decorated_func: Callable,
+        context: ArgumentContext,
+        skip: int = 0
+) -> Callable:
+    """
+    Generates a wrapper whose signature lists the Arguments.
+
+    The source of the wrapper is built and executed once, when the
+    decorator is applied, the same way dataclasses build `__init__`.
+    The rules of the Arguments are inlined in its body, so a call
+    neither packs `*args, **kwargs` nor walks the validation plan.
+
+    Positional parameters follow `schema.positional`, the other
+    Arguments are keyword-only and every parameter defaults to the
+    default of its Argument, or to the default the decorated function
+    declares when the Argument has none. The decorated function
+    receives the resolved values, by position or by keyword as it
+    declares them.
+
+    Parameters
+    ----------
+    schema : ArgumentSchema
+        The schema of the decorated method or function.
+    decorated_func : Callable
+        The decorated method or function.
+    context : ArgumentContext
+        The context giving access to the call in progress.
+    skip : int, default=0
+        The number of leading parameters passed through, such as self.
+
+    Returns
+    -------
+    Callable
+        The generated wrapper.
+
+    Raises
+    ------
+    TypeError
+        If an Argument cannot be a parameter, or if the decorated
+        function declares a parameter which is not an Argument or
+        whose default differs from the default of its Argument.
+    """
+    for name in schema.arguments:
+        if (
+                not name.isidentifier()
+                or keyword.iskeyword(name)
+                or name.startswith('_ag_')
+        ):
+            raise TypeError(
+                f'{schema.name}: {name} cannot be a generated parameter.'
+            )
+    parameters = tuple(
+        inspect.signature(decorated_func).parameters.values()
+    )
+    instance = ['_ag_self'] if skip else []
+    if skip and parameters and parameters[0].name not in schema.arguments:
+        instance = [parameters[0].name]
+    parameters = parameters[skip:]
+    kinds = {parameter.kind for parameter in parameters}
+    named = {}
+    defaults = dict(schema.defaults)
+    for parameter in parameters:
+        if parameter.kind in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD
+        ):
+            continue
+        if parameter.name not in schema.arguments:
+            raise TypeError(
+                f'{schema.name}: the parameter {parameter.name} '
+                f'is not an Argument.'
+            )
+        named[parameter.name] = parameter.kind
+        if parameter.default is inspect.Parameter.empty:
+            continue
+        if defaults[parameter.name] is None:
+            defaults[parameter.name] = parameter.default
+        elif defaults[parameter.name] != parameter.default:
+            raise TypeError(
+                f'{schema.name}: the default of the parameter '
+                f'{parameter.name} differs from the default '
+                f'of its Argument.'
+            )
+    namespace = {
+        '_ag_func': decorated_func,
+        '_ag_schema': schema,
+        '_ag_enter': context.enter,
+        '_ag_exit': context.exit,
+        '_ag_handler': ArgumentHandler._create_trusted,
+        '_ag_isinstance': isinstance,
+    }
+    # Signature
+    signature = list(instance)
+    positional_only = [
+        name for name in schema.positional
+        if named.get(name) is inspect.Parameter.POSITIONAL_ONLY
+    ]
+    for name in schema.positional:
+        signature.append(f'{name}=_ag_defaults[{name!r}]')
+        if positional_only and name == positional_only[-1]:
+            signature.append('/')
+    keyword_only = [
+        name for name in schema.arguments if name not in schema.positional
+    ]
+    if keyword_only:
+        signature.append('*')
+        signature.extend(
+            f'{name}=_ag_defaults[{name!r}]' for name in keyword_only
+        )
+    namespace['_ag_defaults'] = defaults
+    # Checks
+    body = []
+    if schema.sampler is not None and schema.validation:
+        namespace['_ag_sampler'] = schema.sampler
+        body.append('_ag_sampler.validate(_ag_schema, _ag_values)')
+    elif schema.collect_errors:
+        body.append('_ag_schema.validate(_ag_values)')
+    inline = schema.validation and not body
+    for index, (name, argument) in enumerate(schema.arguments.items()):
+        if not inline:
+            break
+        namespace[f'_ag_a{index}'] = argument
+        if argument.type is not Any:
+            namespace[f'_ag_t{index}'] = argument.type
+            body.append(
+                f'if {name} is not None '
+                f'and not _ag_isinstance({name}, _ag_t{index}):\n'
+                f'    raise _ag_a{index}._type_error({name})'
+            )
+        if argument.required and argument.default is None:
+            body.append(
+                f'if not {name} and {name} is not False:\n'
+                f'    raise _ag_a{index}._required_error()'
+            )
+        if argument.choices:
+            namespace[f'_ag_c{index}'] = argument._in_choices
+            guard = '' if argument.required else f'{name} is not None and '
+            body.append(
+                f'if {guard}not _ag_c{index}({name}):\n'
+                f'    raise _ag_a{index}._choices_error({name})'
+            )
+        validators = argument._validators
+        if validators:
+            body.append(f'if {name} is not None:')
+            for position, validator in enumerate(validators):
+                namespace[f'_ag_v{index}_{position}'] = validator.validate
+                body.append(f'    _ag_v{index}_{position}({name})')
+    if inline and body:
+        namespace['_ag_profiling'] = profiling
+        body = [
+            'if _ag_profiling.PROFILER is not None:',
+            '    _ag_schema.validate(_ag_values)',
+            'else:',
+            *(
+                '    ' + line
+                for block in body
+                for line in block.split('\n')
+            )
+        ]
+    values = ', '.join(f'{name!r}: {name}' for name in schema.arguments)
+    body.insert(0, f'_ag_values = {{{values}}}')
+    # Call
+    call = list(instance)
+    if named:
+        call.extend(
+            name if kind is inspect.Parameter.POSITIONAL_ONLY
+            else f'{name}={name}'
+            for name, kind in named.items()
+        )
+    if inspect.Parameter.VAR_KEYWORD in kinds:
+        call.extend(
+            f'{name}={name}' for name in schema.arguments
+            if name not in named
+        )
+    elif inspect.Parameter.VAR_POSITIONAL in kinds and not named:
+        call.extend(schema.positional)
+    body.extend((
+        '_ag_token = _ag_enter(_ag_handler(_ag_schema, _ag_values))',
+        'try:',
+        f'    return _ag_func({", ".join(call)})',
+        'finally:',
+        '    _ag_exit(_ag_token)',
+    ))
+    source = '\n'.join((
+        f'def wrapper({", ".join(signature)}):',
+        *(
+            '    ' + line
+            for block in body
+            for line in block.split('\n')
+        )
+    ))
+    exec(source, namespace)
+    wrapper = functools.update_wrapper(namespace['wrapper'], decorated_func)
+    del wrapper.__wrapped__
+    return wrapper
+
+
+def class_properties(**_properties: Argument) -> Callable:
+    """
+    Decorator for class properties.
+
+    A decorator for class properties allowing you to define the data
+    managed by the class during construction and then access these
+    values within the class.
+
+    The class is patched in place: its `__init__` receives the schema
+    of the properties, unless a decorated subclass already passed its
+    own.
+
+    Parameters
+    ----------
+    _properties
+        A dictionary of the [Arguments][arganic.arguments.Argument]
+        the decorator will handle.
+        Keywords whose value is not an Argument are options:
+
+        - `collect_errors` (bool, default=False): collect the failures
+          of all the Arguments into an
+          [ArgumentErrors][arganic.arguments.ArgumentErrors]
+          instead of raising the first one.
+        - `validation` (bool, default=VALIDATION): validate the values,
+          when False only the defaults are applied, see
+          [VALIDATION][arganic.arguments.VALIDATION].
+        - `sampling` (float | Sampler, default=None): validate only
+          a fraction of the calls, or the calls a
+          [Sampler][arganic.arguments.Sampler] picks.
+        - `attributes` (bool, default=False): make each property an
+          attribute of the instances, `obj.name` reads its value and
+          `obj.name = value` sets it as set() does, unless the class
+          already defines an attribute with that name. Assigning an
+          instance attribute with the name of a property then goes
+          through set(), and so fails for a read-only property.
+
+    Returns
+    -------
+    Callable
+        The decorator function.
+    """
+    properties, options = _split_options(
+        _properties,
+        collect_errors=False,
+        validation=VALIDATION,
+        sampling=None,
+        attributes=False
+    )
+    attributes = options.pop('attributes')
+
+    def properties_decorator(decorated_class) -> Type:
+        schema = ArgumentHandler.set_arguments(
+            decorated_class,
+            ArgumentSchema(properties, **options)
+        )
+
+        init = decorated_class.__init__
+
+        @functools.wraps(init)
+        def __init__(self, *args, **kwargs) -> None:
+            if args and isinstance(args[0], ArgumentSchema):
+                init(self, *args, **kwargs)
+            else:
+                init(self, schema, *args, **kwargs)
+        decorated_class.__init__ = __init__
+        for name in properties if attributes else ():
+            if not hasattr(decorated_class, name):
+                setattr(decorated_class, name, ArgumentHandler._property(name))
+        return decorated_class
+    return properties_decorator
+
+
+def method_arguments(**_arguments: Argument) -> Callable:
+    """
+    Decorator for method arguments.
+
+    A decorator for class methods allowing you to constrain the arguments
+    provided during the call but also to find the correctly formatted
+    values within the method.
+
+    The values of the call in progress are available through the
+    `arguments` attribute of the method, an
+    [ArgumentContext][arganic.arguments.ArgumentContext] which stays
+    correct across threads, asyncio tasks and recursive calls.
+
+    Coroutine methods are wrapped in a coroutine method awaiting the
+    [AsyncValidators][arganic.validators.AsyncValidator] of all the
+    arguments concurrently. The values of generator methods stay
+    available while the generator runs, async generators validate their
+    values when they are first iterated.
+
+    Parameters
+    ----------
+    _arguments
+        A dictionary of the [Arguments][arganic.arguments.Argument]
+        the decorator will handle.
+        Keywords whose value is not an Argument are options:
+
+        - `collect_errors` (bool, default=False): collect the failures
+          of all the Arguments into an
+          [ArgumentErrors][arganic.arguments.ArgumentErrors]
+          instead of raising the first one.
+        - `validation` (bool, default=VALIDATION): validate the values,
+          when False only the defaults are applied, when the values
+          of a call are first read, see
+          [VALIDATION][arganic.arguments.VALIDATION].
+        - `sampling` (float | Sampler, default=None): validate only
+          a fraction of the calls, or the calls a
+          [Sampler][arganic.arguments.Sampler] picks.
+        - `codegen` (bool, default=False): generate a wrapper whose
+          signature lists the Arguments, with their rules inlined.
+          Every named parameter of the decorated callable must be an
+          Argument, whose default, if any, matches the default of the
+          parameter. Coroutine and generator functions keep the
+          dynamic wrapper.
+
+    Returns
+    -------
+    Callable
+        The decorator function.
+    """
+    arguments, options = _split_options(
+        _arguments,
+        collect_errors=False,
+        validation=VALIDATION,
+        sampling=None,
+        codegen=False
+    )
+    codegen = options.pop('codegen')
+
+    def arguments_decorator(decorated_func) -> Callable:
+        schema = ArgumentHandler.set_arguments(
+            decorated_func,
+            ArgumentSchema(arguments, **options)
+        )
+        schema.bind_signature(decorated_func, skip=1)
+        context = ArgumentContext(schema.name)
+
+        plain = not (
+                inspect.iscoroutinefunction(decorated_func)
+                or inspect.isgeneratorfunction(decorated_func)
+                or inspect.isasyncgenfunction(decorated_func)
+        )
+        if plain and not schema.validation:
+            method = context.defer(schema, decorated_func, 1)
+        elif codegen and plain:
+            method = _generate_wrapper(schema, decorated_func, context, 1)
+        elif inspect.isgeneratorfunction(decorated_func):
+            @functools.wraps(decorated_func)
+            def method(instance, *args, **kwargs):
+                return context.iterate(
+                    ArgumentHandler(schema, *args, **kwargs),
+                    decorated_func(instance, *args, **kwargs)
+                )
+        elif inspect.isasyncgenfunction(decorated_func):
+            @functools.wraps(decorated_func)
+            def method(instance, *args, **kwargs):
+                return context.iterate_async(
+                    lambda: ArgumentHandler.create_async(
+                        schema, *args, **kwargs
+                    ),
+                    decorated_func(instance, *args, **kwargs)
+                )
+        elif inspect.iscoroutinefunction(decorated_func):
+            @functools.wraps(decorated_func)
+            async def method(instance, *args, **kwargs):
+                token = context.enter(await ArgumentHandler.create_async(
+                    schema, *args, **kwargs
+                ))
+                try:
+                    return await decorated_func(instance, *args, **kwargs)
+                finally:
+                    context.exit(token)
+        else:
+            @functools.wraps(decorated_func)
+            def method(instance, *args, **kwargs):
+                token = context.enter(
+                    ArgumentHandler(schema, *args, **kwargs)
+                )
+                try:
+                    return decorated_func(instance, *args, **kwargs)
+                finally:
+                    context.exit(token)
+        method.arguments = context
+        return method
+    return arguments_decorator
+
+
+def function_arguments(**_arguments: Argument) -> Callable:
+    """
+    Decorator for function arguments.
+
+    A decorator for functions allowing you to constrain the arguments
+    provided during the call but also to find the correctly formatted values
+    within the function.
+
+    The values of the call in progress are available through the
+    `arguments` attribute of the function, an
+    [ArgumentContext][arganic.arguments.ArgumentContext] which stays
+    correct across threads, asyncio tasks and recursive calls.
+
+    Coroutine functions are wrapped in a coroutine function awaiting the
+    [AsyncValidators][arganic.validators.AsyncValidator] of all the
+    arguments concurrently. The values of generator functions stay
+    available while the generator runs, async generators validate their
+    values when they are first iterated.
+
+    Parameters
+    ----------
+    _arguments
+        A dictionary of the [Arguments][arganic.arguments.Argument]
+        the decorator will handle.
+        Keywords whose value is not an Argument are options:
+
+        - `collect_errors` (bool, default=False): collect the failures
+          of all the Arguments into an
+          [ArgumentErrors][arganic.arguments.ArgumentErrors]
+          instead of raising the first one.
+        - `validation` (bool, default=VALIDATION): validate the values,
+          when False only the defaults are applied, when the values
+          of a call are first read, see
+          [VALIDATION][arganic.arguments.VALIDATION].
+        - `sampling` (float | Sampler, default=None): validate only
+          a fraction of the calls, or the calls a
+          [Sampler][arganic.arguments.Sampler] picks.
+        - `codegen` (bool, default=False): generate a wrapper whose
+          signature lists the Arguments, with their rules inlined.
+          Every named parameter of the decorated callable must be an
+          Argument, whose default, if any, matches the default of the
+          parameter. Coroutine and generator functions keep the
+          dynamic wrapper.
+
+    Returns
+    -------
+    Callable
+        The decorator function.
+    """
+    arguments, options = _split_options(
+        _arguments,
+        collect_errors=False,
+        validation=VALIDATION,
+        sampling=None,
+        codegen=False
+    )
+    codegen = options.pop('codegen')
+
+    def arguments_decorator(decorated_func) -> Callable:
+        schema = ArgumentHandler.set_arguments(
+            decorated_func,
+            ArgumentSchema(arguments, **options)
+        )
+        schema.bind_signature(decorated_func)
+        context = ArgumentContext(schema.name)
+
+        plain = not (
+                inspect.iscoroutinefunction(decorated_func)
+                or inspect.isgeneratorfunction(decorated_func)
+                or inspect.isasyncgenfunction(decorated_func)
+        )
+        if plain and not schema.validation:
+            function = context.defer(schema, decorated_func)
+        elif codegen and plain:
+            function = _generate_wrapper(schema, decorated_func, context)
+        elif inspect.isgeneratorfunction(decorated_func):
+            @functools.wraps(decorated_func)
+            def function(*args, **kwargs):
+                return context.iterate(
+                    ArgumentHandler(schema, *args, **kwargs),
+                    decorated_func(*args, **kwargs)
+                )
+        elif inspect.isasyncgenfunction(decorated_func):
+            @functools.wraps(decorated_func)
+            def function(*args, **kwargs):
+                return context.iterate_async(
+                    lambda: ArgumentHandler.create_async(
+                        schema, *args, **kwargs
+                    ),
+                    decorated_func(*args, **kwargs)
+                )
+        elif inspect.iscoroutinefunction(decorated_func):
+            @functools.wraps(decorated_func)
+            async def function(*args, **kwargs):
+                token = context.enter(await ArgumentHandler.create_async(
+                    schema, *args, **kwargs
+                ))
+                try:
+                    return await decorated_func(*args, **kwargs)
+                finally:
+                    context.exit(token)
+        else:
+            @functools.wraps(decorated_func)
+            def function(*args, **kwargs):
+                token = context.enter(
+                    ArgumentHandler(schema, *args, **kwargs)
+                )
+                try:
+                    return decorated_func(*args, **kwargs)
+                finally:
+                    context.exit(token)
+        function.arguments = context
+        return function
+    return arguments_decorator
+
+
+def validate_many(
+        decorated: ArgumentSchema | type | Callable,
+        records: Iterable[dict]
+) -> list[dict | Exception]:
+    """
+    Validate many records against the Arguments of a decorated
+    class, method or function, without raising.
+
+    The records are validated column by column, reusing the schema
+    compiled by the decorator.
+
+    Parameters
+    ----------
+    decorated : ArgumentSchema | type | Callable
+        The decorated class, method or function.
+    records : Iterable[dict]
+        The records to validate.
+
+    Returns
+    -------
+    list[dict | Exception]
+        For each record, in order, the validated values or
+        the exception raised by its first failing rule.
+    """
+    return ArgumentHandler.get_schema(decorated).validate_many(records)
+
+
+async def validate_many_async(
+        decorated: ArgumentSchema | type | Callable,
+        records: Iterable[dict]
+) -> list[dict | Exception]:
+    """
+    Validate many records against the Arguments of a decorated
+    class, method or function, without raising, awaiting the
+    AsyncValidators of all the records concurrently.
+
+    Parameters
+    ----------
+    decorated : ArgumentSchema | type | Callable
+        The decorated class, method or function.
+    records : Iterable[dict]
+        The records to validate.
+
+    Returns
+    -------
+    list[dict | Exception]
+        For each record, in order, the validated values or
+        the exception raised by its first failing rule.
+    """
+    return await ArgumentHandler.get_schema(
+        decorated
+    ).validate_many_async(records)
+
+
+def iter_validate(
+        decorated: ArgumentSchema | type | Callable,
+        records: Iterable[dict]
+) -> Iterator[dict | Exception]:
+    """
+    Lazily validate a stream of records against the Arguments of a
+    decorated class, method or function, without raising.
+
+    Records are pulled from the iterable one at a time, as the
+    results are consumed, so memory use stays constant.
+
+    Parameters
+    ----------
+    decorated : ArgumentSchema | type | Callable
+        The decorated class, method or function.
+    records : Iterable[dict]
+        The records to validate.
+
+    Yields
+    ------
+    dict | Exception
+        For each record, in order, the validated values or
+        the exception of its first failing rule.
+    """
+    return ArgumentHandler.get_schema(decorated).iter_validate(records)
+
+
+def iter_validate_async(
+        decorated: ArgumentSchema | type | Callable,
+        records: Iterable[dict] | AsyncIterable[dict]
+) -> AsyncIterator[dict | Exception]:
+    """
+    Lazily validate a stream of records against the Arguments of a
+    decorated class, method or function, without raising, awaiting
+    the AsyncValidators of each record concurrently.
+
+    Parameters
+    ----------
+    decorated : ArgumentSchema | type | Callable
+        The decorated class, method or function.
+    records : Iterable[dict] | AsyncIterable[dict]
+        The records to validate.
+
+    Yields
+    ------
+    dict | Exception
+        For each record, in order, the validated values or
+        the exception of its first failing rule.
+    """
+    return ArgumentHandler.get_schema(decorated).iter_validate_async(records)
+
+
+def collect_errors(
+        decorated: ArgumentSchema | type | Callable,
+        values: dict
+) -> ArgumentErrors:
+    """
+    Check values against every rule of the Arguments of a decorated
+    class, method or function, and collect all the failures.
+
+    Parameters
+    ----------
+    decorated : ArgumentSchema | type | Callable
+        The decorated class, method or function.
+    values : dict
+        The values to check.
+
+    Returns
+    -------
+    ArgumentErrors
+        The failures, empty if all the values are valid.
+    """
+    return ArgumentHandler.get_schema(decorated).collect(values)
+
+
+async def collect_errors_async(
+        decorated: ArgumentSchema | type | Callable,
+        values: dict
+) -> ArgumentErrors:
+    """
+    Check values against every rule of the Arguments of a decorated
+    class, method or function, and collect all the failures, awaiting
+    the AsyncValidators concurrently.
+
+    Parameters
+    ----------
+    decorated : ArgumentSchema | type | Callable
+        The decorated class, method or function.
+    values : dict
+        The values to check.
+
+    Returns
+    -------
+    ArgumentErrors
+        The failures, empty if all the values are valid.
+    """
+    return await ArgumentHandler.get_schema(decorated).collect_async(values)
@@ -0,0 +1,424 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+class Timing:
+    """
+    The timings recorded for a decorated object, an argument rule
+    or a validator.
+
+    Attributes
+    ----------
+    calls : int
+        The number of recorded runs.
+    total : float
+        The cumulated duration of the runs, in seconds.
+    failures : dict[str, int]
+        The number of failed runs by reason.
+    """
+    __slots__ = ('calls', 'total', 'failures', '__samples')
+
+    def __init__(self, samples: int = 1024) -> None:
+        """
+        Timing constructor.
+
+        Parameters
+        ----------
+        samples: int, default=1024
+            The number of latest durations kept for the percentiles.
+        """
+        self.calls: int = 0
+        self.total: float = 0.0
+        self.failures: dict[str, int] = {}
+        self.__samples: deque = deque(maxlen=samples)
+
+    def add(self, seconds: float, reason: str | None = None) -> None:
+        """
+        Records a run.
+
+        Parameters
+        ----------
+        seconds : float
+            The duration of the run.
+        reason : str | None, default=None
+            Why the run failed, None if it did not.
+        """
+        self.calls += 1
+        self.total += seconds
+        self.__samples.append(seconds)
+        if reason is not None:
+            self.failures[reason] = self.failures.get(reason, 0) + 1
+
+    def percentile(self, rank: float) -> float:
+        """
+        A percentile of the latest durations.
+
+        Parameters
+        ----------
+        rank : float
+            The percentile, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The duration in seconds, 0.0 if nothing was recorded.
+        """
+        if not self.__samples:
+            return 0.0
+        ordered = sorted(self.__samples)
+        return ordered[min(
+            len(ordered) - 1,
+            int(len(ordered) * rank / 100)
+        )]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        The timings as a dict.
+
+        Returns
+        -------
+        dict[str, Any]
+            The `calls`, `total`, `mean`, `p50`, `p90`, `p99` durations
+            in seconds and the `failures` by reason.
+        """
+        return {
+            'calls': self.calls,
+            'total': self.total,
+            'mean': self.total / self.calls if self.calls else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'failures': dict(self.failures),
+        }
+
+
+class Profiler:
+    """
+    Records how long the validation of the decorated objects takes.
+
+    Each validation is timed as a whole for its decorated object, and
+    each rule of the plan for its argument and its validator. Rules are
+    labelled `type`, `required`, `choices` or by the class name of
+    their validator. Failures are counted by the `argument:rule` which
+    failed for decorated objects, by exception class for rules.
+
+    Enable a profiler with [enable][arganic.profiling.enable], the
+    validation is not timed at all while no profiler is enabled.
+
+    Methods
+    -------
+    validate(schema, values)
+        Runs and times the validation of the values.
+
+    validate_async(schema, values)
+        Runs and times the validation of the values, awaiting
+        the AsyncValidators of all the arguments concurrently.
+
+    snapshot()
+        The recorded timings.
+
+    reset()
+        Forgets the recorded timings.
+    """
+    __slots__ = (
+        '__samples',
+        '__hook',
+        '__lock',
+        '__targets',
+        '__rules',
+        '__validators',
+    )
+
+    def __init__(
+            self,
+            samples: int = 1024,
+            hook: Callable[[str, str, float, str | None], Any] | None = None
+    ) -> None:
+        """
+        Profiler constructor.
+
+        Parameters
+        ----------
+        samples: int, default=1024
+            The number of latest durations kept for the percentiles
+            of each timing.
+        hook: Callable[[str, str, float, str | None], Any] | None
+            Called after each timed rule with the name of the decorated
+            object, the `argument:rule` label, the duration in seconds
+            and the failure reason or None.
+        """
+        self.__samples: int = samples
+        self.__hook: Callable | None = hook
+        self.__lock: threading.Lock = threading.Lock()
+        self.__targets: dict[str, Timing] = {}
+        self.__rules: dict[str, Timing] = {}
+        self.__validators: dict[str, Timing] = {}
+
+    def __timing(self, timings: dict[str, Timing], key: str) -> Timing:
+        timing = timings.get(key)
+        if timing is None:
+            timing = timings[key] = Timing(self.__samples)
+        return timing
+
+    def record(
+            self,
+            target: str,
+            rule: str | None,
+            seconds: float,
+            reason: str | None = None
+    ) -> None:
+        """
+        Records a timed run.
+
+        Parameters
+        ----------
+        target : str
+            The name of the decorated object.
+        rule : str | None
+            The `argument:rule` label, None for a whole validation.
+        seconds : float
+            The duration of the run.
+        reason : str | None, default=None
+            Why the run failed, None if it did not.
+        """
+        with self.__lock:
+            if rule is None:
+                self.__timing(self.__targets, target).add(seconds, reason)
+                return
+            self.__timing(
+                self.__rules, f'{target}.{rule}'
+            ).add(seconds, reason)
+            self.__timing(
+                self.__validators, rule.rpartition(':')[2]
+            ).add(seconds, reason)
+        if self.__hook is not None:
+            self.__hook(target, rule, seconds, reason)
+
+    def validate(self, schema, values: dict) -> bool:
+        """
+        Runs and times the validation of the values.
+
+        In collect errors mode, the validation is only timed as a whole.
+
+        Parameters
+        ----------
+        schema : ArgumentSchema
+            The schema of the decorated object.
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        bool
+            True if all the values are valid.
+        """
+        started = time.perf_counter()
+        reason = None
+        try:
+            if schema.collect_errors:
+                errors = schema.collect(values)
+                if errors:
+                    reason = f'{errors[0].name}:{errors[0].code}'
+                    raise errors
+                return True
+            for key, default, check in schema.plan:
+                reason = f'{key}:{getattr(check, "rule", check.__name__)}'
+                self.__check(
+                    schema.name, reason, check, values.get(key, default)
+                )
+            reason = None
+            return True
+        finally:
+            self.record(
+                schema.name, None, time.perf_counter() - started, reason
+            )
+
+    async def validate_async(self, schema, values: dict) -> bool:
+        """
+        Runs and times the validation of the values, awaiting
+        the AsyncValidators of all the arguments concurrently.
+
+        Parameters
+        ----------
+        schema : ArgumentSchema
+            The schema of the decorated object.
+        values : dict
+            The provided values, missing ones take their default value.
+
+        Returns
+        -------
+        bool
+            True if all the values are valid.
+        """
+        started = time.perf_counter()
+        reason = None
+        try:
+            if schema.collect_errors:
+                errors = await schema.collect_async(values)
+                if errors:
+                    reason = f'{errors[0].name}:{errors[0].code}'
+                    raise errors
+                return True
+            for key, default, check in schema.async_plan:
+                reason = f'{key}:{getattr(check, "rule", check.__name__)}'
+                self.__check(
+                    schema.name, reason, check, values.get(key, default)
+                )
+            reason = None
+            awaiting = []
+            for key, default, validator in schema.awaitables:
+                value = values.get(key, default)
+                if value is not None:
+                    awaiting.append(self.__await(
+                        schema.name, key, validator, value
+                    ))
+            if awaiting:
+                reason = 'async'
+                await asyncio.gather(*awaiting)
+                reason = None
+            return True
+        finally:
+            self.record(
+                schema.name, None, time.perf_counter() - started, reason
+            )
+
+    def __check(
+            self,
+            target: str,
+            rule: str,
+            check: Callable,
+            value: Any
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            check(value)
+        except Exception as error:
+            self.record(
+                target,
+                rule,
+                time.perf_counter() - started,
+                type(error).__name__
+            )
+            raise
+        self.record(target, rule, time.perf_counter() - started)
+
+    async def __await(
+            self,
+            target: str,
+            key: str,
+            validator: Any,
+            value: Any
+    ) -> None:
+        rule = f'{key}:{type(validator).__name__}'
+        started = time.perf_counter()
+        try:
+            await validator.validate_async(value)
+        except Exception as error:
+            self.record(
+                target,
+                rule,
+                time.perf_counter() - started,
+                type(error).__name__
+            )
+            raise
+        self.record(target, rule, time.perf_counter() - started)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        The recorded timings.
+
+        Returns
+        -------
+        dict[str, dict[str, dict[str, Any]]]
+            The timings of each decorated object in `targets`, of each
+            `target.argument:rule` in `rules` and of each rule label,
+            such as a validator class name, in `validators`.
+        """
+        with self.__lock:
+            return {
+                'targets': {
+                    key: timing.to_dict()
+                    for key, timing in self.__targets.items()
+                },
+                'rules': {
+                    key: timing.to_dict()
+                    for key, timing in self.__rules.items()
+                },
+                'validators': {
+                    key: timing.to_dict()
+                    for key, timing in self.__validators.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """
+        Forgets the recorded timings.
+        """
+        with self.__lock:
+            self.__targets.clear()
+            self.__rules.clear()
+            self.__validators.clear()
+
+
+PROFILER: Profiler | None = None
+"""
+The enabled profiler, None while profiling is disabled.
+"""
+
+
+def enable(
+        samples: int = 1024,
+        hook: Callable[[str, str, float, str | None], Any] | None = None
+) -> Profiler:
+    """
+    Enables profiling, at runtime, for all the decorated objects.
+
+    Parameters
+    ----------
+    samples: int, default=1024
+        The number of latest durations kept for the percentiles.
+    hook: Callable[[str, str, float, str | None], Any] | None
+        Called after each timed rule, see
+        [Profiler][arganic.profiling.Profiler].
+
+    Returns
+    -------
+    Profiler
+        The enabled profiler.
+    """
+    global PROFILER
+    PROFILER = Profiler(samples, hook)
+    return PROFILER
+
+
+def disable() -> Profiler | None:
+    """
+    Disables profiling.
+
+    Returns
+    -------
+    Profiler | None
+        The profiler which was enabled, with its timings.
+    """
+    global PROFILER
+    profiler, PROFILER = PROFILER, None
+    return profiler
+
+
+def snapshot() -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    The timings recorded by the enabled profiler.
+
+    Returns
+    -------
+    dict[str, dict[str, dict[str, Any]]]
+        The timings, see [Profiler.snapshot][arganic.profiling.Profiler],
+        empty sections when profiling is disabled.
+    """
+    if PROFILER is None:
+        return {'targets': {}, 'rules': {}, 'validators': {}}
+    return PROFILER.snapshot()
@@ -1,7 +1,15 @@
+import asyncio
 import os.path
 import errno
+import ipaddress
 import re
+import stat
+import threading
+import time
 from abc import abstractmethod, ABC
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Validator(ABC):
@@ -20,6 +28,8 @@ class Validator(ABC):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -41,11 +51,515 @@ class Validator(ABC):
         """
         pass
 
+    def is_valid(self, value) -> bool:
+        """
+        Checks a value without raising.
+
+        Override this method on inherited classes to avoid building
+        an exception for invalid values: by default, it calls
+        validate() and catches its exceptions.
+
+        Parameters
+        ----------
+        value
+            The value to check.
+
+        Returns
+        -------
+        bool
+            True if the validation pass, False otherwise.
+        """
+        try:
+            self.validate(value)
+        except Exception:
+            return False
+        return True
+
+    async def is_valid_async(self, value) -> bool:
+        """
+        Checks a value without raising, from a running event loop.
+
+        Parameters
+        ----------
+        value
+            The value to check.
+
+        Returns
+        -------
+        bool
+            True if the validation pass, False otherwise.
+        """
+        return self.is_valid(value)
+
+
+class AsyncValidator(Validator):
+    """
+    Base class for validators whose validation can be awaited.
+
+    Extend this class for I/O-bound validations: async decorated
+    methods and functions await the AsyncValidators of all their
+    arguments concurrently.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def validate_async(self, value) -> bool:
+        """
+        Override this method on inherited classes.
+
+        Parameters
+        ----------
+        value
+            The value to validate.
+
+        Returns
+        -------
+        bool
+            The validate_async() methods needs to return True if the
+            validation pass or raises an exception if the validation fails.
+        """
+        pass
+
+    def validate(self, value) -> bool:
+        """
+        Runs validate_async() to completion in a new event loop.
+
+        Parameters
+        ----------
+        value
+            The value to validate.
+
+        Returns
+        -------
+        bool
+            True if the validation pass.
+
+        Raises
+        ------
+        RuntimeError
+            If called from a running event loop, await
+            validate_async() instead.
+        """
+        self.__check_no_loop()
+        return asyncio.run(self.validate_async(value))
+
+    def is_valid(self, value) -> bool:
+        """
+        Runs is_valid_async() to completion in a new event loop.
+
+        Parameters
+        ----------
+        value
+            The value to check.
+
+        Returns
+        -------
+        bool
+            True if the validation pass, False otherwise.
+
+        Raises
+        ------
+        RuntimeError
+            If called from a running event loop, await
+            is_valid_async() instead.
+        """
+        self.__check_no_loop()
+        return asyncio.run(self.is_valid_async(value))
+
+    async def is_valid_async(self, value) -> bool:
+        """
+        Awaits validate_async() without raising.
+
+        Parameters
+        ----------
+        value
+            The value to check.
+
+        Returns
+        -------
+        bool
+            True if the validation pass, False otherwise.
+        """
+        try:
+            await self.validate_async(value)
+        except Exception:
+            return False
+        return True
+
+    def __check_no_loop(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise RuntimeError(
+            f'{type(self).__name__} can not be validated synchronously '
+            f'from a running event loop.'
+        )
+
+
+class StatCache:
+    """
+    A cache of file system lookups for the File and Dir validators.
+
+    Share one instance between validators so that validating the
+    same paths again does not make a stat system call each time.
+    Lookups are kept in least recently used order and expire after
+    a time to live. In polling mode, a background thread refreshes
+    all the cached lookups at a fixed interval instead.
+
+    Methods
+    -------
+    mode(path)
+        The st_mode of a path, None if it does not exist.
+
+    store(path, mode)
+        Stores the lookup of a path made elsewhere.
+
+    invalidate(path=None)
+        Forgets the lookup of a path, or of all paths.
 
-class Dir(Validator):
+    close()
+        Stops the polling thread.
+    """
+    __slots__ = (
+        '__maxsize',
+        '__ttl',
+        '__refresh',
+        '__entries',
+        '__lock',
+        '__poller',
+        '__stopped',
+    )
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            ttl: float | None = 5.0,
+            refresh: float | None = None
+    ) -> None:
+        """
+        Stat cache constructor.
+
+        Parameters
+        ----------
+        maxsize: int, default=1024
+            The maximum number of paths kept in the cache.
+        ttl: float | None, default=5.0
+            Seconds before a lookup expires, None to never expire.
+            Lookups do not expire in polling mode.
+        refresh: float | None, default=None
+            Polling mode: seconds between two refreshes of all
+            the cached lookups by a background thread.
+        """
+        self.__maxsize: int = maxsize
+        self.__ttl: float | None = ttl
+        self.__refresh: float | None = refresh
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__poller: threading.Thread | None = None
+        self.__stopped: threading.Event = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @staticmethod
+    def read(path) -> int | None:
+        """
+        Reads the st_mode of a path from the file system.
+
+        Parameters
+        ----------
+        path
+            The path to look up.
+
+        Returns
+        -------
+        int | None
+            The st_mode of the path, None if it does not exist
+            or can not be accessed.
+        """
+        try:
+            return os.stat(path).st_mode
+        except (OSError, ValueError):
+            return None
+
+    def mode(self, path) -> int | None:
+        """
+        The st_mode of a path, from the cache when possible.
+
+        Parameters
+        ----------
+        path
+            The path to look up.
+
+        Returns
+        -------
+        int | None
+            The st_mode of the path, None if it does not exist
+            or can not be accessed.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__entries.get(path)
+            if entry is not None and (entry[1] is None or entry[1] > now):
+                self.__entries.move_to_end(path)
+                return entry[0]
+            if self.__refresh is not None and self.__poller is None:
+                self.__poller = threading.Thread(
+                    target=self.__poll,
+                    name='arganic-stat-cache',
+                    daemon=True
+                )
+                self.__poller.start()
+        mode = StatCache.read(path)
+        self.store(path, mode)
+        return mode
+
+    def store(self, path, mode: int | None) -> None:
+        """
+        Stores the lookup of a path made elsewhere.
+
+        Parameters
+        ----------
+        path
+            The path looked up.
+        mode: int | None
+            The st_mode of the path, None if it does not exist.
+        """
+        expires = None
+        if self.__ttl is not None and self.__refresh is None:
+            expires = time.monotonic() + self.__ttl
+        with self.__lock:
+            self.__entries[path] = (mode, expires)
+            self.__entries.move_to_end(path)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, path=None) -> None:
+        """
+        Forgets the lookup of a path, or of all the paths.
+
+        Parameters
+        ----------
+        path: optional
+            The path to forget, all the paths if not provided.
+        """
+        with self.__lock:
+            if path is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(path, None)
+
+    def close(self) -> None:
+        """
+        Stops the polling thread, if any.
+        """
+        self.__stopped.set()
+        if self.__poller is not None:
+            self.__poller.join()
+
+    def __poll(self) -> None:
+        while not self.__stopped.wait(self.__refresh):
+            with self.__lock:
+                paths = list(self.__entries)
+            for path in paths:
+                mode = StatCache.read(path)
+                with self.__lock:
+                    if path in self.__entries:
+                        self.__entries[path] = (mode, None)
+
+
+class PathValidator(AsyncValidator):
+    """
+    Base class for the validators checking the file system.
+
+    The lookups can be served by a
+    [StatCache][arganic.validators.StatCache], and are made in a
+    worker thread when awaited.
+    """
+    __slots__ = ('__cache',)
+
+    def __init__(self, cache: StatCache | None = None) -> None:
+        """
+        Path Validator constructor.
+
+        Parameters
+        ----------
+        cache: StatCache, optional
+            The cache serving the file system lookups.
+        """
+        self.__cache: StatCache | None = cache
+        super().__init__()
+
+    @property
+    def cache(self) -> StatCache | None:
+        """
+        The cache serving the file system lookups, if any.
+        <hr />
+        """
+        return self.__cache
+
+    @staticmethod
+    @abstractmethod
+    def _matches(mode: int) -> bool:
+        pass
+
+    def _exists(self, path) -> bool:
+        if self.__cache is None:
+            mode = StatCache.read(path)
+        else:
+            mode = self.__cache.mode(path)
+        return mode is not None and self._matches(mode)
+
+    def check_many(
+            self,
+            paths,
+            max_workers: int | None = None
+    ) -> tuple[list, list]:
+        """
+        Checks many paths at once, reading each parent directory once.
+
+        The paths are grouped by parent directory and each directory
+        is listed with a single os.scandir() call, instead of one
+        stat system call per path. The names missing from the listing,
+        such as names spelt differently on a case-insensitive file
+        system, are looked up on their own, so the result agrees with
+        validate(). The lookups are stored in the cache of the
+        validator, if any.
+
+        Parameters
+        ----------
+        paths: Iterable
+            The paths to check.
+        max_workers: int, optional
+            Read the directories from a pool of this many threads.
+
+        Returns
+        -------
+        tuple[list, list]
+            The paths passing the validation and the missing ones,
+            in the order they were provided.
+        """
+        paths = list(paths)
+        locations = [PathValidator.__locate(path) for path in paths]
+        directories = defaultdict(set)
+        for location in locations:
+            if location is not None:
+                directories[location[0]].add(location[1])
+        if max_workers and len(directories) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                scans = list(executor.map(
+                    PathValidator.__scan, directories.items()
+                ))
+        else:
+            scans = map(PathValidator.__scan, directories.items())
+        modes = {}
+        for scan in scans:
+            modes.update(scan)
+        existing = []
+        missing = []
+        for path, location in zip(paths, locations):
+            if location is None:
+                mode = StatCache.read(path)
+            else:
+                mode = modes[location]
+            if self.__cache is not None:
+                self.__cache.store(path, mode)
+            if mode is not None and self._matches(mode):
+                existing.append(path)
+            else:
+                missing.append(path)
+        return existing, missing
+
+    @staticmethod
+    def __locate(path) -> tuple | None:
+        directory, name = os.path.split(os.fspath(path))
+        current = os.curdir if isinstance(name, str) else b'.'
+        parent = os.pardir if isinstance(name, str) else b'..'
+        if name in ('', current, parent):
+            return None
+        return directory or current, name
+
+    @staticmethod
+    def __scan(item: tuple) -> dict[tuple, int | None]:
+        directory, names = item
+        modes = {(directory, name): None for name in names}
+        try:
+            with os.scandir(directory) as scanner:
+                for entry in scanner:
+                    if entry.name not in names:
+                        continue
+                    if entry.is_dir():
+                        mode = stat.S_IFDIR
+                    elif entry.is_file():
+                        mode = stat.S_IFREG
+                    else:
+                        mode = StatCache.read(entry.path)
+                    modes[(directory, entry.name)] = mode
+        except (FileNotFoundError, NotADirectoryError):
+            return modes
+        except OSError:
+            pass
+        for name in names:
+            if modes[(directory, name)] is None:
+                modes[(directory, name)] = StatCache.read(
+                    os.path.join(directory, name)
+                )
+        return modes
+
+    def is_valid(self, value) -> bool:
+        """
+        Checks the path without raising.
+
+        Parameters
+        ----------
+        value: str
+            The path to check.
+
+        Returns
+        -------
+        bool
+            True if the value is a path which exists and is
+            of the validated kind.
+        """
+        return isinstance(value, (str, bytes, os.PathLike)) and (
+            self._exists(value)
+        )
+
+    async def validate_async(self, value) -> bool:
+        """
+        Validates the path in a worker thread,
+        without blocking the event loop.
+
+        Parameters
+        ----------
+        value: str
+            The path to validate.
+
+        Returns
+        -------
+        bool
+            True if the validation succeeded.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the path does not exist on the file system.
+        """
+        return await asyncio.to_thread(self.validate, value)
+
+
+class Dir(PathValidator):
     """
     Directory Validator.
     """
+    __slots__ = ()
+
+    @staticmethod
+    def _matches(mode: int) -> bool:
+        return stat.S_ISDIR(mode)
+
     def validate(self, value) -> bool:
         """
         Test the existence of a directory according to the path provided.
@@ -72,7 +586,7 @@ class Dir(Validator):
 
         <hr />
         """
-        if not os.path.isdir(value):
+        if not self.is_valid(value):
             raise FileNotFoundError(
                 errno.ENOENT,
                 os.strerror(errno.ENOENT),
@@ -84,7 +598,41 @@ class Dir(Validator):
 class Email(Validator):
     """
     Email address Validator.
+
+    By default, addresses are checked against a simple pattern
+    covering the common addresses. The strict mode accepts any
+    RFC 5322 addr-spec, quoted local parts and domain literals
+    included (comments and folding white spaces excepted).
     """
+    __slots__ = ('__match',)
+
+    PATTERN = re.compile(
+        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    )
+    __atom = r"[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+"
+    __dot_atom = rf'{__atom}(?:\.{__atom})*'
+    __quoted_pair = r'\\[\x20-\x7e\t]'
+    STRICT_PATTERN = re.compile(
+        rf'(?:{__dot_atom}'
+        rf'|"(?:[\x20\t\x21\x23-\x5b\x5d-\x7e]|{__quoted_pair})*")'
+        rf'@(?:{__dot_atom}'
+        rf'|\[(?:[\x21-\x5a\x5e-\x7e]|{__quoted_pair})*\])'
+    )
+
+    def __init__(self, strict: bool = False) -> None:
+        """
+        Email Validator constructor.
+
+        Parameters
+        ----------
+        strict: bool, default=False
+            Accept any RFC 5322 address.
+        """
+        self.__match: Callable = (
+            Email.STRICT_PATTERN.fullmatch if strict else Email.PATTERN.match
+        )
+        super().__init__()
+
     def validate(self, value) -> bool:
         """
         Validates the syntax of an email address.
@@ -111,17 +659,40 @@ class Email(Validator):
 
         <hr />
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, value):
+        if not self.is_valid(value):
             raise ValueError(f"The value provided: '{value}' is not a "
                              f"correctly formatted email address.")
         return True
 
+    def is_valid(self, value) -> bool:
+        """
+        Checks the syntax of an email address without raising.
+
+        Parameters
+        ----------
+        value: str
+            Email address whose syntax must be checked.
+
+        Returns
+        -------
+        bool
+            True if the value is a correctly formatted email address.
+        """
+        return isinstance(value, str) and '@' in value and (
+            self.__match(value) is not None
+        )
+
 
-class File(Validator):
+class File(PathValidator):
     """
     File Validator
     """
+    __slots__ = ()
+
+    @staticmethod
+    def _matches(mode: int) -> bool:
+        return stat.S_ISREG(mode)
+
     def validate(self, value) -> bool:
         """
         Test the existence of a file according to the path provided.
@@ -148,7 +719,7 @@ class File(Validator):
 
         <hr />
         """
-        if not os.path.isfile(value):
+        if not self.is_valid(value):
             raise FileNotFoundError(
                 errno.ENOENT,
                 os.strerror(errno.ENOENT),
@@ -162,6 +733,8 @@ class MaxLength(Validator):
     Maximum length validator.
     """
 
+    __slots__ = ('__max_length',)
+
     def __init__(self, max_length: int) -> None:
         """
         Max length Validator constructor.
@@ -214,12 +787,34 @@ class MaxLength(Validator):
                              f"maximum length: {self.__max_length}")
         return True
 
+    def is_valid(self, value) -> bool:
+        """
+        Checks the maximum length of a value without raising.
+
+        Parameters
+        ----------
+        value
+            The value to check.
+
+        Returns
+        -------
+        bool
+            True if the value has a length which is not longer
+            than the maximum length.
+        """
+        try:
+            return len(value) <= self.__max_length
+        except TypeError:
+            return False
+
 
 class MinLength(Validator):
     """
     Minimum length validator.
     """
 
+    __slots__ = ('__min_length',)
+
     def __init__(self, min_length: int) -> None:
         """
         Max length Validator constructor.
@@ -272,11 +867,67 @@ class MinLength(Validator):
                              f"minimum length: {self.__min_length}")
         return True
 
+    def is_valid(self, value) -> bool:
+        """
+        Checks the minimum length of a value without raising.
+
+        Parameters
+        ----------
+        value
+            The value to check.
+
+        Returns
+        -------
+        bool
+            True if the value has a length which is not shorter
+            than the minimum length.
+        """
+        try:
+            return len(value) >= self.__min_length
+        except TypeError:
+            return False
+
 
 class Url(Validator):
     """
     URL Validator.
+
+    By default, only the scheme of the URL is checked. The strict
+    mode parses the whole URL according to the RFC 3986 grammar.
     """
+    __slots__ = ('__strict',)
+
+    SCHEMES = ('http://', 'https://', 'ftp://', 'ftps://')
+    __unreserved = r'A-Za-z0-9\-._~'
+    __sub_delims = r"!$&'()*+,;="
+    __pct_encoded = r'%[0-9A-Fa-f]{2}'
+    __pchar = rf'(?:[{__unreserved}{__sub_delims}:@]|{__pct_encoded})'
+    STRICT_PATTERN = re.compile(
+        rf'(?:https?|ftps?)://'
+        rf'(?:(?:[{__unreserved}{__sub_delims}:]|{__pct_encoded})*@)?'
+        rf'(?P<host>\[[^\]]*\]'
+        rf'|(?:[{__unreserved}{__sub_delims}]|{__pct_encoded})+)'
+        rf'(?::[0-9]*)?'
+        rf'(?:/{__pchar}*)*'
+        rf'(?:\?(?:{__pchar}|[/?])*)?'
+        rf'(?:#(?:{__pchar}|[/?])*)?'
+    )
+    IPVFUTURE_PATTERN = re.compile(
+        rf'[vV][0-9A-Fa-f]+\.[{__unreserved}{__sub_delims}:]+'
+    )
+
+    def __init__(self, strict: bool = False) -> None:
+        """
+        Url Validator constructor.
+
+        Parameters
+        ----------
+        strict: bool, default=False
+            Parse the whole URL according to RFC 3986.
+        """
+        self.__strict: bool = strict
+        super().__init__()
+
     def validate(self, value) -> bool:
         """
         Validate if an URL is well formatted.
@@ -306,7 +957,43 @@ class Url(Validator):
 
         <hr />
         """
-        pattern = r'^(?:http|ftp)s?://'
-        if not re.match(pattern, value):
+        if not self.is_valid(value):
             raise ValueError(f"The Url: {value} is not well formatted.")
         return True
+
+    def is_valid(self, value) -> bool:
+        """
+        Checks if an URL is well formatted without raising.
+
+        Parameters
+        ----------
+        value: str
+            The value of the URL to check.
+
+        Returns
+        -------
+        bool
+            True if the value is a well formatted URL.
+        """
+        return isinstance(value, str) and value.startswith(Url.SCHEMES) and (
+            not self.__strict or Url.__parses(value)
+        )
+
+    @staticmethod
+    def __parses(value: str) -> bool:
+        match = Url.STRICT_PATTERN.fullmatch(value)
+        if match is None:
+            return False
+        host = match.group('host')
+        if not host.startswith('['):
+            return True
+        literal = host[1:-1]
+        if Url.IPVFUTURE_PATTERN.fullmatch(literal):
+            return True
+        if '%' in literal:
+            return False
+        try:
+            ipaddress.IPv6Address(literal)
+        except ValueError:
+            return False
+        return True
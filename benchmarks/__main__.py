@@ -0,0 +1,65 @@
+"""
+Runs the benchmark suite and emits its results as JSON.
+
+Run from the repository root:
+
+    python -m benchmarks                        # all, JSON to stdout
+    python -m benchmarks calls validators       # some of them
+    python -m benchmarks --quick -o after.json  # fewer iterations
+    python -m benchmarks --baseline before.json # exit 1 on regression
+"""
+import argparse
+import importlib
+import json
+import sys
+
+from benchmarks.harness import compare, dump, environment
+
+SUITE = ('calls', 'construction', 'validators', 'memory')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        'benchmarks',
+        nargs='*',
+        help=f'the benchmarks to run among {", ".join(SUITE)}, all by default'
+    )
+    parser.add_argument('-o', '--output', help='write the JSON to a file')
+    parser.add_argument(
+        '--quick',
+        action='store_true',
+        help='run a tenth of the iterations'
+    )
+    parser.add_argument(
+        '--baseline',
+        help='the JSON of a previous run to check for regressions'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='the tolerated slowdown against the baseline (0.1 = 10%%)'
+    )
+    options = parser.parse_args(argv)
+    for name in options.benchmarks:
+        if name not in SUITE:
+            parser.error(f'unknown benchmark {name}')
+    scale = 0.1 if options.quick else 1.0
+    results = {
+        name: importlib.import_module(f'benchmarks.{name}').run(scale)
+        for name in options.benchmarks or SUITE
+    }
+    dump({'environment': environment(), 'results': results}, options.output)
+    if options.baseline is None:
+        return 0
+    with open(options.baseline) as file:
+        baseline = json.load(file)['results']
+    regressions = compare(baseline, results, options.threshold)
+    for path, (before, after) in sorted(regressions.items()):
+        print(f'{path}: {before} ns -> {after} ns', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
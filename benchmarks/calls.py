@@ -0,0 +1,80 @@
+"""
+Call overhead of @function_arguments and @method_arguments against
+undecorated callables, for the dynamic and generated wrappers and
+with validation off.
+
+Run from the repository root:
+
+    python -m benchmarks.calls
+"""
+from arganic.arguments import Argument, function_arguments, method_arguments
+from benchmarks.harness import measure, scaled
+
+
+def arguments() -> dict[str, Argument]:
+    return {
+        'start': Argument(type=str),
+        'destination': Argument(
+            type=str,
+            choices=('Paris', 'Rome', 'Milan')
+        ),
+        'passengers': Argument(type=int, default=1),
+    }
+
+
+def drive(start, destination, passengers=1):
+    return start
+
+
+class Car:
+
+    def drive(self, start, destination, passengers=1):
+        return start
+
+    dynamic_drive = method_arguments(**arguments())(drive)
+    generated_drive = method_arguments(**arguments(), codegen=True)(drive)
+    unchecked_drive = method_arguments(
+        **arguments(),
+        validation=False
+    )(drive)
+
+
+dynamic_drive = function_arguments(**arguments())(drive)
+generated_drive = function_arguments(**arguments(), codegen=True)(drive)
+unchecked_drive = function_arguments(**arguments(), validation=False)(drive)
+
+
+def run(scale: float = 1.0) -> dict:
+    number = scaled(100_000, scale)
+    car = Car()
+    functions = {
+        'undecorated': drive,
+        'dynamic': dynamic_drive,
+        'codegen': generated_drive,
+        'validation_off': unchecked_drive,
+    }
+    methods = {
+        'undecorated': car.drive,
+        'dynamic': car.dynamic_drive,
+        'codegen': car.generated_drive,
+        'validation_off': car.unchecked_drive,
+    }
+    return {
+        kind: {
+            name: measure(
+                lambda func=func: func(
+                    'Geneva', destination='Paris', passengers=2
+                ),
+                number
+            )
+            for name, func in callables.items()
+        }
+        for kind, callables in (('function', functions),
+                                ('method', methods))
+    }
+
+
+if __name__ == '__main__':
+    for kind, results in run().items():
+        for name, result in results.items():
+            print(f'{kind} {name}: {result["ns"]} ns/call')
@@ -0,0 +1,66 @@
+"""
+Instantiation cost of @class_properties classes with a growing number
+of arguments, validated and through construct(), and construction cost
+of Arguments with large choices.
+
+Run from the repository root:
+
+    python -m benchmarks.construction
+"""
+from arganic.arguments import Argument, ArgumentHandler, class_properties
+from benchmarks.harness import measure, scaled
+
+ARGUMENT_COUNTS = (1, 4, 16, 64)
+CHOICE_COUNTS = (10, 1_000, 100_000)
+
+
+def properties_class(count: int) -> type:
+    """
+    A @class_properties class handling `count` typed arguments.
+    """
+    @class_properties(**{
+        f'field_{index}': Argument(type=int, default=index)
+        for index in range(count)
+    })
+    class Properties(ArgumentHandler):
+        __slots__ = ()
+    return Properties
+
+
+def run(scale: float = 1.0) -> dict:
+    instantiation = {}
+    construct = {}
+    for count in ARGUMENT_COUNTS:
+        cls = properties_class(count)
+        values = {f'field_{index}': index + 1 for index in range(count)}
+        instantiation[count] = measure(
+            lambda cls=cls, values=values: cls(**values),
+            scaled(20_000, scale)
+        )
+        construct[count] = measure(
+            lambda cls=cls, values=values: cls.construct(**values),
+            scaled(20_000, scale)
+        )
+    choices = {}
+    for count in CHOICE_COUNTS:
+        members = tuple(range(count))
+        choices[count] = measure(
+            lambda members=members: Argument(
+                type=int,
+                choices=members,
+                default=0
+            ),
+            scaled(max(1, 200_000 // count), scale),
+            repeat=3
+        )
+    return {
+        'class_properties_arguments': instantiation,
+        'construct_arguments': construct,
+        'argument_choices': choices,
+    }
+
+
+if __name__ == '__main__':
+    for name, results in run().items():
+        for count, result in results.items():
+            print(f'{name} {count}: {result["ns"]} ns')
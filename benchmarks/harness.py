@@ -0,0 +1,132 @@
+"""
+Timing, JSON output and regression check shared by the benchmarks.
+
+Only the standard library is used, so the suite runs offline.
+"""
+import json
+import platform
+import statistics
+import sys
+import timeit
+from typing import Any, Callable
+
+
+def measure(
+        func: Callable[[], Any],
+        number: int,
+        repeat: int = 5,
+        per: int = 1
+) -> dict[str, float]:
+    """
+    Times func the pyperf way: one warmup run, then `repeat` runs of
+    `number` calls each.
+
+    Parameters
+    ----------
+    func : Callable[[], Any]
+        The operation to time.
+    number : int
+        The number of calls per run.
+    repeat : int, default=5
+        The number of runs.
+    per : int, default=1
+        The number of operations done by one call of func.
+
+    Returns
+    -------
+    dict[str, float]
+        The best (`ns`), mean and standard deviation of the runs,
+        in nanoseconds per operation.
+    """
+    timeit.timeit(func, number=max(1, number // 10))
+    runs = [
+        seconds / number / per * 1e9
+        for seconds in timeit.repeat(func, number=number, repeat=repeat)
+    ]
+    return {
+        'ns': round(min(runs), 1),
+        'mean_ns': round(statistics.mean(runs), 1),
+        'stdev_ns': round(statistics.stdev(runs), 1) if repeat > 1 else 0.0,
+    }
+
+
+def scaled(number: int, scale: float) -> int:
+    """
+    The number of calls per run, for a scale factor.
+    """
+    return max(1, int(number * scale))
+
+
+def environment() -> dict[str, str]:
+    """
+    The interpreter and machine the results were measured on.
+    """
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def flatten(results: dict, prefix: str = '') -> dict[str, float]:
+    """
+    The timings of nested results, by dotted path.
+
+    Only the best timings, keys ending with `ns` but not with
+    `mean_ns` or `stdev_ns`, are kept.
+    """
+    flat = {}
+    for key, value in results.items():
+        path = f'{prefix}.{key}' if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        elif (
+                isinstance(value, (int, float))
+                and str(key).endswith('ns')
+                and not str(key).endswith(('mean_ns', 'stdev_ns'))
+        ):
+            flat[path] = value
+    return flat
+
+
+def compare(
+        baseline: dict,
+        current: dict,
+        threshold: float = 0.1
+) -> dict[str, tuple[float, float]]:
+    """
+    The timings slower than the baseline by more than the threshold.
+
+    Parameters
+    ----------
+    baseline : dict
+        Results of a previous run.
+    current : dict
+        Results of this run.
+    threshold : float, default=0.1
+        The tolerated slowdown, 0.1 for 10%.
+
+    Returns
+    -------
+    dict[str, tuple[float, float]]
+        The (baseline, current) timings of each regression.
+    """
+    before = flatten(baseline)
+    return {
+        path: (before[path], value)
+        for path, value in flatten(current).items()
+        if before.get(path) and value > before[path] * (1 + threshold)
+    }
+
+
+def dump(data: dict, path: str | None = None) -> None:
+    """
+    Writes results as JSON to a file, or to the standard output.
+    """
+    text = json.dumps(data, indent=2, sort_keys=True)
+    if path is None:
+        print(text)
+        return
+    with open(path, 'w') as file:
+        file.write(text + '\n')
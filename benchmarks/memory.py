@@ -0,0 +1,101 @@
+"""
+Memory footprint and value read latency of @class_properties objects.
+
+Run from the repository root:
+
+    python -m benchmarks.memory
+"""
+import tracemalloc
+
+from arganic.arguments import Argument, ArgumentHandler, class_properties
+from benchmarks.harness import measure, scaled
+
+
+@class_properties(
+    name=Argument(
+        type=str
+    ),
+    kind=Argument(
+        type=str,
+        choices=('car', 'truck', 'bike'),
+        default='car'
+    ),
+    description=Argument(
+        type=str,
+        required=False
+    ),
+    attributes=True
+)
+class Vehicle(ArgumentHandler):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+
+@class_properties(
+    name=Argument(
+        type=str
+    ),
+    kind=Argument(
+        type=str,
+        choices=('car', 'truck', 'bike'),
+        default='car'
+    ),
+    description=Argument(
+        type=str,
+        required=False
+    ),
+    attributes=True
+)
+class SlottedVehicle(ArgumentHandler):
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+
+def instance_size(cls: type, count: int = 100_000) -> float:
+    """
+    Average number of bytes allocated per instance.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(name=f'vehicle {index}') for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def read_latency(cls: type, number: int = 1_000_000) -> float:
+    """
+    Nanoseconds per self.get() read.
+    """
+    instance = cls(name='vehicle')
+    return measure(lambda: instance.get('kind'), number)['ns']
+
+
+def attribute_latency(cls: type, number: int = 1_000_000) -> float:
+    """
+    Nanoseconds per self.kind attribute read.
+    """
+    instance = cls(name='vehicle')
+    return measure(lambda: instance.kind, number)['ns']
+
+
+def run(scale: float = 1.0) -> dict:
+    return {
+        name: {
+            'bytes_per_instance': round(
+                instance_size(cls, scaled(100_000, scale)), 1
+            ),
+            'get_ns': read_latency(cls, scaled(1_000_000, scale)),
+            'attribute_ns': attribute_latency(cls, scaled(1_000_000, scale)),
+        }
+        for name, cls in (('Vehicle', Vehicle),
+                          ('SlottedVehicle', SlottedVehicle))
+    }
+
+
+if __name__ == '__main__':
+    for name, result in run().items():
+        print(f'{name}: {result}')
@@ -0,0 +1,92 @@
+"""
+Per-value cost of the validators.
+
+The legacy entries reproduce the previous implementation, which
+looked the pattern up in the re module cache on every call.
+
+Run from the repository root:
+
+    python -m benchmarks.validators
+"""
+import os
+import re
+import tempfile
+
+from arganic.validators import (
+    Dir,
+    Email,
+    File,
+    MaxLength,
+    MinLength,
+    Url
+)
+from benchmarks.harness import measure, scaled
+
+
+EMAILS = ('first.last@example.com', 'not-an-email', 'dd@com')
+URLS = ('https://www.example.com/a/b?c=d', 'example.com', 'ftp://host/x')
+TEXTS = ('', 'short', 'a somewhat longer text value')
+
+
+def legacy_email(value: str) -> bool:
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    if not re.match(pattern, value):
+        raise ValueError(f"The value provided: '{value}' is not a "
+                         f"correctly formatted email address.")
+    return True
+
+
+def legacy_url(value: str) -> bool:
+    pattern = r'^(?:http|ftp)s?://'
+    if not re.match(pattern, value):
+        raise ValueError(f"The Url: {value} is not well formatted.")
+    return True
+
+
+def is_valid(validate) -> callable:
+    def check(value) -> bool:
+        try:
+            return validate(value)
+        except ValueError:
+            return False
+    return check
+
+
+def per_value(check, values: tuple, number: int) -> dict[str, float]:
+    """
+    Nanoseconds per validated value.
+    """
+    def run() -> None:
+        for value in values:
+            check(value)
+    return measure(run, number, per=len(values))
+
+
+def run(scale: float = 1.0) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        file = os.path.join(directory, 'file.txt')
+        with open(file, 'w'):
+            pass
+        paths = (file, directory, os.path.join(directory, 'missing'))
+        cases = {
+            'email_legacy': (is_valid(legacy_email), EMAILS),
+            'email': (is_valid(Email().validate), EMAILS),
+            'email_strict': (is_valid(Email(strict=True).validate), EMAILS),
+            'url_legacy': (is_valid(legacy_url), URLS),
+            'url': (is_valid(Url().validate), URLS),
+            'url_strict': (is_valid(Url(strict=True).validate), URLS),
+            'min_length': (MinLength(5).is_valid, TEXTS),
+            'max_length': (MaxLength(10).is_valid, TEXTS),
+            'file': (File().is_valid, paths),
+            'dir': (Dir().is_valid, paths),
+        }
+        number = scaled(50_000, scale)
+        return {
+            name: per_value(check, values, number)
+            for name, (check, values) in cases.items()
+        }
+
+
+if __name__ == '__main__':
+    for name, result in run().items():
+        print(f'{name}: {result["ns"]} ns/value')
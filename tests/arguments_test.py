@@ -0,0 +1,1495 @@
+import asyncio
+import contextvars
+import copy
+import gc
+import inspect
+import itertools
+import json
+import os
+import pickle
+import subprocess
+import sys
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from arganic import arguments
+from arganic.arguments import (
+    Argument,
+    ArgumentErrors,
+    ArgumentSchema,
+    ArgumentHandler,
+    Sampler,
+    class_properties,
+    collect_errors,
+    collect_errors_async,
+    function_arguments,
+    iter_validate,
+    iter_validate_async,
+    method_arguments,
+    validate_many,
+    validate_many_async
+)
+from arganic.validators import (
+    AsyncValidator,
+    File,
+    MinLength,
+    MaxLength,
+    Url,
+    Validator
+)
+
+
+class TestArgumentSchema:
+
+    def test_untyped_argument_has_no_check(self):
+        schema = ArgumentSchema({'free': Argument(required=False)})
+        assert schema.plan == ()
+
+    def test_only_declared_rules_are_compiled(self):
+        schema = ArgumentSchema({
+            'typed': Argument(type=str, required=False),
+            'checked': Argument(
+                type=str,
+                validator=(MinLength(1), MaxLength(3))
+            ),
+        })
+        assert [key for key, default, check in schema.plan] == [
+            'typed', 'checked', 'checked', 'checked', 'checked'
+        ]
+
+    def test_arguments_are_named(self):
+        argument = Argument(type=int)
+        ArgumentSchema({'number': argument})
+        assert argument.name == 'number'
+
+    def test_validate(self):
+        schema = ArgumentSchema({
+            'name': Argument(type=str, choices=('a', 'b')),
+            'size': Argument(type=int, default=1),
+        })
+        assert schema.validate({'name': 'a'})
+
+    def test_validate_type(self):
+        schema = ArgumentSchema({'size': Argument(type=int, default=1)})
+        try:
+            schema.validate({'size': '1'})
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_validate_required(self):
+        schema = ArgumentSchema({'name': Argument(type=str)})
+        try:
+            schema.validate({})
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_validate_choices(self):
+        schema = ArgumentSchema({
+            'name': Argument(type=str, choices=('a', 'b'), required=False)
+        })
+        assert schema.validate({})
+        try:
+            schema.validate({'name': 'c'})
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+
+class TestChoices:
+
+    def test_large_choices(self):
+        codes = tuple(f'C{index:05d}' for index in range(20000))
+        argument = Argument(type=str, choices=codes)
+        assert argument.validate('C19999')
+        try:
+            argument.validate('C20000')
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_unhashable_choices(self):
+        argument = Argument(choices=('a', ['a', 'b'], {'c': 1}))
+        assert argument.validate('a')
+        assert argument.validate(['a', 'b'])
+        assert argument.validate({'c': 1})
+        try:
+            argument.validate(['b'])
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_choices_type_checked(self):
+        try:
+            Argument(type=str, choices=('a', 1))
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_choices_validated(self):
+        try:
+            Argument(type=str, choices=('a', 'bbb'), validator=MaxLength(2))
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_falsy_choice(self):
+        argument = Argument(type=int, choices=(0, 1), default=0)
+        assert argument.validate(1)
+
+
+class CountingValidator(Validator):
+    raised = 0
+
+    def validate(self, value) -> bool:
+        if not self.is_valid(value):
+            CountingValidator.raised += 1
+            raise ValueError(f'{value} is odd.')
+        return True
+
+    def is_valid(self, value) -> bool:
+        return value % 2 == 0
+
+
+class TestIsValid:
+
+    def test_argument(self):
+        argument = Argument(
+            type=int,
+            choices=(2, 4, 6),
+            validator=CountingValidator()
+        )
+        assert argument.is_valid(2)
+        assert not argument.is_valid('2')
+        assert not argument.is_valid(8)
+        assert not Argument(validator=CountingValidator()).is_valid(3)
+        assert not Argument(type=int).is_valid(None)
+        assert Argument(type=int, required=False).is_valid(None)
+
+    def test_no_exception_built(self):
+        CountingValidator.raised = 0
+        schema = ArgumentSchema({
+            'number': Argument(type=int, validator=CountingValidator())
+        })
+        assert schema.is_valid({'number': 2})
+        assert not schema.is_valid({'number': 3})
+        assert CountingValidator.raised == 0
+
+    def test_validator_called_once(self):
+        CountingValidator.raised = 0
+        schema = ArgumentSchema({
+            'number': Argument(type=int, validator=CountingValidator())
+        })
+        errors = schema.collect({'number': 3})
+        assert CountingValidator.raised == 1
+        assert errors[0].message == '3 is odd.'
+        assert CountingValidator.raised == 1
+
+    def test_wrong_type_for_validator(self):
+        schema = ArgumentSchema({
+            'name': Argument(required=False, validator=MaxLength(2)),
+            'url': Argument(required=False, validator=Url()),
+        })
+        assert not schema.is_valid({'name': 5, 'url': 'http://a'})
+        assert not schema.is_valid({'name': 'a', 'url': 5})
+        assert [error.code for error in schema.collect({
+            'name': 5, 'url': 5
+        })] == ['validator', 'validator']
+        results = schema.validate_many([{'name': 5}, {'url': 5}])
+        assert isinstance(results[0], TypeError)
+        assert isinstance(results[1], ValueError)
+
+
+class Registered:
+    pass
+
+
+registered_schema = ArgumentHandler.set_arguments(
+    Registered,
+    {'size': Argument(type=int, default=1)}
+)
+
+
+class TestArgumentRegistration:
+
+    def test_set_arguments_names_schema(self):
+        assert registered_schema.name == 'tests.arguments_test.Registered'
+
+    def test_handler_from_decorated(self):
+        handler = ArgumentHandler(Registered)
+        assert handler.get('size') == 1
+
+    def test_handler_from_schema(self):
+        schema = ArgumentSchema({'size': Argument(type=int, default=1)})
+        handler = ArgumentHandler(schema, size=3)
+        assert handler.get('size') == 3
+
+    def test_get_default(self):
+        schema = ArgumentSchema({
+            'size': Argument(type=int, default=1, read_only=False)
+        })
+        provided = {}
+        handler = ArgumentHandler(schema, provided)
+        handler.set('size', 2)
+        assert handler.get('size') == 2 and provided == {}
+
+    def test_values_snapshot(self):
+        schema = ArgumentSchema({
+            'size': Argument(type=int, default=1, read_only=False)
+        })
+        handler = ArgumentHandler(schema)
+        values = handler.values
+        assert handler.values is values
+        handler.set('size', 2)
+        assert values == {'size': 1} and handler.values == {'size': 2}
+
+    def test_values_read_only(self):
+        values = ArgumentHandler(registered_schema).values
+        try:
+            values['size'] = 2
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_values_json(self):
+        values = ArgumentHandler(registered_schema).values
+        assert json.loads(json.dumps(values)) == dict(values)
+
+    def test_values_deepcopy(self):
+        values = ArgumentHandler(registered_schema).values
+        copied = copy.deepcopy(values)
+        assert copied == values and copied is not values
+        try:
+            copied.update(size=2)
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_values_pickle(self):
+        values = ArgumentHandler(registered_schema).values
+        assert pickle.loads(pickle.dumps(values)) == values
+
+    def test_get_unknown(self):
+        try:
+            ArgumentHandler(registered_schema).get('unknown')
+        except KeyError:
+            assert True
+        else:
+            assert False
+
+    def test_handler_unregistered(self):
+        try:
+            ArgumentHandler(TestArgumentRegistration)
+        except KeyError:
+            assert True
+        else:
+            assert False
+
+
+@function_arguments(
+    depth=Argument(
+        type=int
+    )
+)
+def recursive(*args, **kwargs) -> list:
+    depth = recursive.arguments.get('depth')
+    inner = recursive(depth=depth - 1) if depth > 1 else []
+    return [recursive.arguments.get('depth')] + inner
+
+
+@function_arguments(
+    value=Argument(
+        type=int
+    )
+)
+def slow_echo(*args, **kwargs) -> int:
+    time.sleep(0.001)
+    return slow_echo.arguments.get('value')
+
+
+class TestArgumentContext:
+
+    def test_recursive_calls(self):
+        assert recursive(depth=3) == [3, 2, 1]
+
+    def test_threads(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda value: slow_echo(value=value),
+                range(1, 101)
+            ))
+        assert results == list(range(1, 101))
+
+    def test_no_call_in_progress(self):
+        try:
+            slow_echo.arguments.get('value')
+        except LookupError:
+            assert True
+        else:
+            assert False
+
+
+class SlowCityValidator(AsyncValidator):
+    async def validate_async(self, value) -> bool:
+        await asyncio.sleep(0.01)
+        if value in ('Geneva', 'Paris'):
+            return True
+        raise ValueError('Invalid value')
+
+
+@function_arguments(
+    start=Argument(
+        type=str,
+        validator=SlowCityValidator()
+    ),
+    destination=Argument(
+        type=str,
+        validator=SlowCityValidator()
+    ),
+    log=Argument(
+        type=str,
+        required=False,
+        validator=File()
+    )
+)
+async def async_drive(*args, **kwargs) -> dict:
+    await asyncio.sleep(0.01)
+    return async_drive.arguments.values
+
+
+@function_arguments(count=Argument(type=int))
+def countdown(**kwargs):
+    for value in range(countdown.arguments.get('count'), 0, -1):
+        received = yield value
+        if received is not None:
+            yield received * countdown.arguments.get('count')
+    return countdown.arguments.get('count')
+
+
+class Counter:
+
+    @method_arguments(count=Argument(type=int))
+    def up(self, **kwargs):
+        for value in range(1, self.up.arguments.get('count') + 1):
+            yield value
+
+    @method_arguments(count=Argument(type=int))
+    async def up_async(self, **kwargs):
+        for value in range(1, self.up_async.arguments.get('count') + 1):
+            await asyncio.sleep(0)
+            yield value
+
+
+@function_arguments(start=Argument(type=str, validator=SlowCityValidator()))
+async def async_stops(**kwargs):
+    yield async_stops.arguments.get('start')
+
+
+class TestGenerators:
+
+    def test_generator(self):
+        assert list(countdown(count=3)) == [3, 2, 1]
+
+    def test_nested_generators(self):
+        assert list(zip(countdown(count=2), countdown(count=3))) == [
+            (2, 3), (1, 2)
+        ]
+
+    def test_send_and_return(self):
+        generator = countdown(count=2)
+        assert next(generator) == 2
+        assert generator.send(5) == 10
+        assert list(generator) == [1]
+
+    def test_return_value(self):
+        def delegate():
+            return (yield from countdown(count=1))
+        generator = delegate()
+        assert next(generator) == 1
+        try:
+            next(generator)
+        except StopIteration as stop:
+            assert stop.value == 1
+        else:
+            assert False
+
+    def test_validated_on_call(self):
+        try:
+            countdown(count='3')
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_no_leak_between_steps(self):
+        generator = countdown(count=2)
+        next(generator)
+        try:
+            countdown.arguments.get('count')
+        except LookupError:
+            assert True
+        else:
+            assert False
+
+    def test_method(self):
+        assert list(Counter().up(count=3)) == [1, 2, 3]
+
+    def test_async_generator(self):
+        async def collect():
+            return [value async for value in Counter().up_async(count=3)]
+        assert asyncio.run(collect()) == [1, 2, 3]
+
+    def test_async_generator_validation(self):
+        async def collect(start):
+            return [value async for value in async_stops(start=start)]
+        assert asyncio.run(collect('Geneva')) == ['Geneva']
+        try:
+            asyncio.run(collect('Lyon'))
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+
+class TestAsync:
+
+    def test_async_function(self):
+        assert asyncio.run(async_drive(start='Geneva', destination='Paris')) == {
+            'start': 'Geneva', 'destination': 'Paris', 'log': None
+        }
+
+    def test_async_validators_fail(self):
+        try:
+            asyncio.run(async_drive(start='Geneva', destination='Lyon'))
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_async_file_validator_fail(self):
+        try:
+            asyncio.run(async_drive(
+                start='Geneva',
+                destination='Paris',
+                log='file/that/not/exists'
+            ))
+        except FileNotFoundError:
+            assert True
+        else:
+            assert False
+
+    def test_concurrent_tasks(self):
+        async def run() -> list:
+            return await asyncio.gather(
+                async_drive(start='Geneva', destination='Paris'),
+                async_drive(start='Paris', destination='Geneva'),
+            )
+        first, second = asyncio.run(run())
+        assert first['start'] == 'Geneva' and second['start'] == 'Paris'
+
+
+@class_properties(
+    name=Argument(
+        type=str
+    ),
+    country=Argument(
+        type=str,
+        choices=('CH', 'FR', 'ES'),
+        default='CH'
+    ),
+    tags=Argument(
+        type=list,
+        required=False,
+        choices=(['a'], ['b']),
+        validator=MaxLength(1)
+    )
+)
+class Row(ArgumentHandler):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+
+class TestValidateMany:
+
+    def test_valid_rows(self):
+        assert validate_many(Row, [
+            {'name': 'a'},
+            {'name': 'b', 'country': 'FR', 'tags': ['b']},
+        ]) == [
+            {'name': 'a', 'country': 'CH', 'tags': None},
+            {'name': 'b', 'country': 'FR', 'tags': ['b']},
+        ]
+
+    def test_errors_do_not_stop_validation(self):
+        results = validate_many(Row, [
+            {'name': 1},
+            {'country': 'FR'},
+            {'name': 'c', 'country': 'IT'},
+            {'name': 'd', 'tags': ['c']},
+            {'name': 'e'},
+        ])
+        assert isinstance(results[0], TypeError)
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], ValueError)
+        assert isinstance(results[3], ValueError)
+        assert results[4] == {'name': 'e', 'country': 'CH', 'tags': None}
+
+    def test_same_error_as_construction(self):
+        record = {'name': 'c', 'country': 'IT'}
+        try:
+            Row(**record)
+        except ValueError as error:
+            assert str(validate_many(Row, [record])[0]) == str(error)
+        else:
+            assert False
+
+    def test_decorated_function(self):
+        results = validate_many(slow_echo, [{'value': 1}, {'value': '1'}])
+        assert results[0] == {'value': 1}
+        assert isinstance(results[1], TypeError)
+
+    def test_async_validators(self):
+        results = validate_many(async_drive, [
+            {'start': 'Geneva', 'destination': 'Paris'},
+            {'start': 'Lyon', 'destination': 'Paris'},
+            {'start': 1, 'destination': 'Paris'},
+        ])
+        assert results[0]['start'] == 'Geneva'
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], TypeError)
+
+    def test_running_loop(self):
+        async def validate():
+            return validate_many(async_drive, [
+                {'start': 'Geneva', 'destination': 'Paris'}
+            ])
+
+        try:
+            asyncio.run(validate())
+        except RuntimeError:
+            assert True
+        else:
+            assert False
+
+    def test_sync_path_validators(self):
+        @function_arguments(
+            log=Argument(type=str, validator=File()),
+            collect_errors=True
+        )
+        def logged(**kwargs):
+            return logged.arguments.get('log')
+
+        async def validate():
+            assert logged(log=__file__) == __file__
+            assert collect_errors(logged, {'log': __file__}).errors == ()
+            assert ArgumentHandler.get_schema(logged).is_valid(
+                {'log': __file__}
+            )
+            return validate_many(logged, [
+                {'log': __file__}, {'log': 'not/a/file'}
+            ])
+
+        results = asyncio.run(validate())
+        assert results[0] == {'log': __file__}
+        assert isinstance(results[1], FileNotFoundError)
+
+    def test_async(self):
+        results = asyncio.run(validate_many_async(async_drive, [
+            {'start': 'Geneva', 'destination': 'Paris'},
+            {'start': 'Geneva', 'destination': 'Lyon'},
+        ]))
+        assert results[0]['destination'] == 'Paris'
+        assert isinstance(results[1], ValueError)
+
+
+class TestIterValidate:
+
+    def test_results(self):
+        results = list(iter_validate(Row, [
+            {'name': 'a'},
+            {'name': 'b', 'country': 'IT'},
+        ]))
+        assert results[0] == {'name': 'a', 'country': 'CH', 'tags': None}
+        assert isinstance(results[1], ValueError)
+
+    def test_same_results_as_validate_many(self):
+        records = [
+            {'name': 1},
+            {'country': 'FR'},
+            {'name': 'd', 'tags': ['c']},
+            {'name': 'e', 'tags': ['a']},
+        ]
+        assert [
+            str(result) for result in iter_validate(Row, records)
+        ] == [
+            str(result) for result in validate_many(Row, records)
+        ]
+
+    def test_lazy(self):
+        pulled = []
+
+        def records():
+            for index in itertools.count():
+                pulled.append(index)
+                yield {'name': str(index)}
+
+        results = iter_validate(Row, records())
+        assert next(results)['name'] == '0'
+        assert next(results)['name'] == '1'
+        assert pulled == [0, 1]
+
+    def test_async_validators(self):
+        results = list(iter_validate(async_drive, [
+            {'start': 'Geneva', 'destination': 'Paris'},
+            {'start': 'Lyon', 'destination': 'Paris'},
+        ]))
+        assert results[0]['start'] == 'Geneva'
+        assert isinstance(results[1], ValueError)
+
+    def test_async(self):
+        async def records():
+            yield {'start': 'Paris', 'destination': 'Geneva'}
+            yield {'start': 'Paris', 'destination': 'Lyon'}
+
+        async def validate():
+            return [
+                result
+                async for result in iter_validate_async(async_drive, records())
+            ]
+
+        results = asyncio.run(validate())
+        assert results[0]['start'] == 'Paris'
+        assert isinstance(results[1], ValueError)
+
+
+@function_arguments(
+    collect_errors=True,
+    name=Argument(
+        type=str
+    ),
+    country=Argument(
+        type=str,
+        choices=('CH', 'FR'),
+        default='CH'
+    ),
+    code=Argument(
+        type=str,
+        required=False,
+        validator=(MinLength(2), MaxLength(4))
+    )
+)
+def register(*args, **kwargs) -> dict:
+    return register.arguments.values
+
+
+class TestCollectErrors:
+
+    def test_valid(self):
+        errors = collect_errors(Row, {'name': 'a'})
+        assert not errors and len(errors) == 0
+
+    def test_all_arguments_checked(self):
+        errors = collect_errors(Row, {'country': 'IT', 'tags': ['a', 'b']})
+        assert [(error.name, error.code) for error in errors] == [
+            ('name', 'required'),
+            ('country', 'choices'),
+            ('tags', 'choices'),
+        ]
+
+    def test_messages(self):
+        errors = collect_errors(Row, {'name': 1})
+        assert errors.to_list() == [{
+            'name': 'name',
+            'code': 'type',
+            'message': str(ArgumentHandler.get_schema(Row).arguments['name']
+                           ._type_error(1)),
+        }]
+
+    def test_exception(self):
+        error = collect_errors(Row, {'name': 1})[0]
+        assert isinstance(error.exception, TypeError)
+
+    def test_decorator_option(self):
+        try:
+            register(country='IT', code='x')
+        except ArgumentErrors as errors:
+            assert [error.code for error in errors] == [
+                'required', 'choices', 'validator'
+            ]
+            assert len(str(errors).splitlines()) == 3
+        else:
+            assert False
+
+    def test_decorator_option_valid(self):
+        assert register(name='a')['country'] == 'CH'
+
+    def test_unknown_option(self):
+        try:
+            function_arguments(unknown=True)
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_async_collect(self):
+        schema = ArgumentSchema({
+            'start': Argument(type=str, validator=SlowCityValidator()),
+            'destination': Argument(type=str, validator=SlowCityValidator()),
+            'log': Argument(type=str, required=False, validator=File()),
+        })
+        errors = asyncio.run(schema.collect_async({
+            'start': 'Lyon', 'destination': 1, 'log': 'not/a/file'
+        }))
+        assert [(error.name, error.code) for error in errors] == [
+            ('destination', 'type'),
+            ('start', 'validator'),
+            ('log', 'validator'),
+        ]
+
+    def test_async_validators(self):
+        errors = collect_errors(async_drive, {
+            'start': 'Lyon', 'destination': 'Paris'
+        })
+        assert [(error.name, error.code) for error in errors] == [
+            ('start', 'validator'),
+        ]
+
+    def test_async_running_loop(self):
+        errors = asyncio.run(collect_errors_async(async_drive, {
+            'start': 'Geneva', 'destination': 'Paris'
+        }))
+        assert not errors
+
+
+@function_arguments(
+    start=Argument(type=str),
+    destination=Argument(type=str),
+    stops=Argument(type=int, default=0)
+)
+def route(start, destination, stops=0):
+    return dict(route.arguments.values)
+
+
+@function_arguments(options=Argument(type=dict, default={}))
+def configure(options):
+    return configure.arguments.get('options')
+
+
+class Planner:
+
+    @method_arguments(start=Argument(type=str), destination=Argument(type=str))
+    def plan(self, start, destination):
+        return self.plan.arguments.get('destination')
+
+
+@class_properties(x=Argument(type=int), y=Argument(type=int, default=0))
+class Point(ArgumentHandler):
+    pass
+
+
+class TestPositionalBinding:
+
+    def test_function(self):
+        assert route('Geneva', 'Paris') == {
+            'start': 'Geneva', 'destination': 'Paris', 'stops': 0
+        }
+
+    def test_mixed(self):
+        assert route('Geneva', destination='Paris', stops=2)['stops'] == 2
+
+    def test_positional_is_validated(self):
+        try:
+            route('Geneva', 1)
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_multiple_values(self):
+        try:
+            route('Geneva', 'Paris', start='Lyon')
+        except TypeError as error:
+            assert 'multiple values' in str(error)
+        else:
+            assert False
+
+    def test_method(self):
+        assert Planner().plan('Geneva', 'Paris') == 'Paris'
+
+    def test_class(self):
+        point = Point(1, 2)
+        assert (point.get('x'), point.get('y')) == (1, 2)
+
+    def test_dict_values(self):
+        assert Point({'x': 3}).get('x') == 3
+
+    def test_dict_argument(self):
+        assert configure({'debug': True}) == {'debug': True}
+
+
+@function_arguments(
+    start=Argument(type=str, validator=MaxLength(10)),
+    destination=Argument(type=str, choices=('Paris', 'Rome')),
+    stops=Argument(type=int, default=0),
+    codegen=True
+)
+def generated_route(start, destination, **kwargs):
+    return start, destination, kwargs
+
+
+class GeneratedPlanner:
+
+    @method_arguments(
+        start=Argument(type=str),
+        destination=Argument(type=str, required=False),
+        codegen=True
+    )
+    def plan(self, *args, **kwargs):
+        return self.plan.arguments.values, kwargs
+
+
+class TestCodegen:
+
+    def test_signature(self):
+        assert str(inspect.signature(generated_route)) == (
+            '(start=None, destination=None, *, stops=0)'
+        )
+        assert generated_route.__name__ == 'generated_route'
+
+    def test_call(self):
+        assert generated_route('Geneva', destination='Rome', stops=2) == (
+            'Geneva', 'Rome', {'stops': 2}
+        )
+
+    def test_default(self):
+        assert generated_route('Geneva', 'Paris')[2] == {'stops': 0}
+
+    def test_type(self):
+        try:
+            generated_route(1, 'Paris')
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_required(self):
+        try:
+            generated_route(destination='Paris')
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_choices(self):
+        try:
+            generated_route('Geneva', 'Lyon')
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_validator(self):
+        try:
+            generated_route('Saint-Jean-de-Luz', 'Paris')
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_unknown_keyword(self):
+        try:
+            generated_route('Geneva', 'Paris', driver='Ann')
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_method(self):
+        values, kwargs = GeneratedPlanner().plan('Geneva')
+        assert dict(values) == kwargs == {
+            'start': 'Geneva', 'destination': None
+        }
+
+    def test_undeclared_parameter(self):
+        try:
+            @function_arguments(start=Argument(type=str), codegen=True)
+            def undeclared(start, driver):
+                pass
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_collect_errors(self):
+        @function_arguments(
+            start=Argument(type=str),
+            destination=Argument(type=str),
+            collect_errors=True,
+            codegen=True
+        )
+        def collected(**kwargs):
+            pass
+        try:
+            collected(start=1)
+        except ArgumentErrors as errors:
+            assert len(errors) == 2
+        else:
+            assert False
+
+    def test_builtin_names(self):
+        @function_arguments(
+            isinstance=Argument(type=str),
+            len=Argument(type=int, default=0),
+            codegen=True
+        )
+        def shadowing(**kwargs):
+            return kwargs
+
+        assert shadowing(isinstance='a', len=2) == {
+            'isinstance': 'a', 'len': 2
+        }
+        try:
+            shadowing(isinstance=1)
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_function_defaults(self):
+        def search(query, limit=10):
+            return query, limit
+
+        dynamic = function_arguments(
+            query=Argument(type=str),
+            limit=Argument(type=int, required=False)
+        )(search)
+        generated = function_arguments(
+            query=Argument(type=str),
+            limit=Argument(type=int, required=False),
+            codegen=True
+        )(search)
+        assert generated('q') == dynamic('q') == ('q', 10)
+        assert generated('q', 5) == dynamic('q', 5) == ('q', 5)
+
+    def test_conflicting_defaults(self):
+        try:
+            @function_arguments(
+                limit=Argument(type=int, default=20),
+                codegen=True
+            )
+            def search(limit=10):
+                pass
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_invalid_identifier(self):
+        try:
+            function_arguments(
+                **{'my-arg': Argument(type=str)},
+                codegen=True
+            )(lambda **kwargs: kwargs)
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_generator(self):
+        @function_arguments(count=Argument(type=int), codegen=True)
+        def counting(count):
+            for index in range(count):
+                yield counting.arguments.get('count') - index
+
+        assert list(counting(2)) == [2, 1]
+
+
+@class_properties(
+    name=Argument(type=str),
+    size=Argument(type=int, default=1, read_only=False),
+    validation=False
+)
+class Unchecked(ArgumentHandler):
+    __slots__ = ()
+
+
+class TestValidationOff:
+
+    def test_function(self):
+        @function_arguments(
+            start=Argument(type=str),
+            stops=Argument(type=int, default=0),
+            validation=False
+        )
+        def unchecked(**kwargs):
+            return dict(unchecked.arguments.values)
+        assert unchecked(start=1) == {'start': 1, 'stops': 0}
+
+    def test_codegen(self):
+        @function_arguments(
+            start=Argument(type=str, choices=('Geneva',)),
+            validation=False,
+            codegen=True
+        )
+        def unchecked(start):
+            return start
+        assert unchecked('Paris') == 'Paris'
+
+    def test_handler_built_when_read(self):
+        @function_arguments(
+            start=Argument(type=str),
+            stops=Argument(type=int, default=0, read_only=False),
+            validation=False
+        )
+        def unchecked(*args, read=True, **kwargs):
+            if not read:
+                return None
+            copied = contextvars.copy_context().run(
+                lambda: unchecked.arguments.current
+            )
+            unchecked.arguments.set('stops', 2)
+            return copied is unchecked.arguments.current, dict(
+                unchecked.arguments.values
+            )
+        assert unchecked('Geneva', read=False) is None
+        assert unchecked('Geneva') == (True, {'start': 'Geneva', 'stops': 2})
+
+    def test_method(self):
+        class Planner:
+            @method_arguments(start=Argument(type=str), validation=False)
+            def plan(self, *args, **kwargs):
+                return self, self.plan.arguments.get('start')
+
+        planner = Planner()
+        assert planner.plan(1) == (planner, 1)
+
+    def test_async(self):
+        @function_arguments(
+            start=Argument(type=str, validator=SlowCityValidator()),
+            validation=False
+        )
+        async def unchecked(**kwargs):
+            return unchecked.arguments.get('start')
+        assert asyncio.run(unchecked(start='Lyon')) == 'Lyon'
+
+    def test_class(self):
+        unchecked = Unchecked()
+        assert unchecked.get('name') is None
+        assert unchecked.get('size') == 1
+
+    def test_set(self):
+        unchecked = Unchecked(name='a')
+        unchecked.set('size', 'large')
+        assert unchecked.get('size') == 'large'
+
+    def test_set_read_only(self):
+        try:
+            Unchecked(name='a').set('name', 'b')
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_global_mode(self, monkeypatch):
+        monkeypatch.setattr(arguments, 'VALIDATION', False)
+
+        @function_arguments(start=Argument(type=str))
+        def unchecked(**kwargs):
+            return unchecked.arguments.get('start')
+        assert unchecked(start=1) == 1
+
+    def test_environment(self):
+        command = [
+            sys.executable, '-O', '-c',
+            'from arganic.arguments import VALIDATION; print(VALIDATION)'
+        ]
+        for mode, expected in (('', 'True'), ('on', 'True'), ('off', 'False')):
+            output = subprocess.run(
+                command,
+                env={**os.environ, 'ARGANIC_MODE': mode},
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
+            assert output.strip() == expected
+
+
+class TestSampler:
+
+    def test_rate(self):
+        sampler = Sampler(rate=0.25)
+        assert [sampler.sample() for _ in range(8)].count(True) == 2
+
+    def test_exact_count(self):
+        sampler = Sampler(rate=0.1)
+        sampled = [sampler.sample() for _ in range(1000)]
+        assert sampled.count(True) == 100
+        assert sampled[0] and not sampled[1] and sampled[10]
+
+    def test_non_integral_reciprocals(self):
+        for rate in (0.3, 0.4, 0.6, 0.7, 0.75, 0.9):
+            sampler = Sampler(rate=rate)
+            sampled = [sampler.sample() for _ in range(1000)]
+            assert sampled[0]
+            assert sampled.count(True) == round(1000 * rate)
+
+    def test_first(self):
+        sampler = Sampler(first=3, window=60)
+        assert [sampler.sample() for _ in range(5)] == [
+            True, True, True, False, False
+        ]
+
+    def test_window(self):
+        sampler = Sampler(first=1, window=0.01)
+        assert sampler.sample() and not sampler.sample()
+        time.sleep(0.02)
+        assert sampler.sample()
+
+    def test_invalid_rate(self):
+        try:
+            Sampler(rate=2)
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_sampled_calls(self):
+        @function_arguments(start=Argument(type=str), sampling=0.5)
+        def sampled(**kwargs):
+            return sampled.arguments.get('start')
+        outcomes = []
+        for _ in range(4):
+            try:
+                outcomes.append(sampled(start=1))
+            except TypeError:
+                outcomes.append('error')
+        assert outcomes == ['error', 1, 'error', 1]
+        schema = ArgumentHandler.get_schema(sampled)
+        assert schema.sampler.stats() == {
+            'calls': 4,
+            'sampled': 2,
+            'violations': 2,
+            'targets': {schema.name: 2},
+        }
+
+    def test_report(self):
+        reported = []
+        sampler = Sampler(
+            rate=1.0,
+            raises=False,
+            report=lambda name, error: reported.append(type(error))
+        )
+
+        @class_properties(size=Argument(type=int), sampling=sampler)
+        class Sampled(ArgumentHandler):
+            pass
+        assert Sampled(size='large').get('size') == 'large'
+        assert reported == [TypeError]
+        assert sampler.stats()['violations'] == 1
+
+    def test_codegen(self):
+        sampler = Sampler(first=1, window=60, raises=False)
+
+        @function_arguments(
+            start=Argument(type=str),
+            sampling=sampler,
+            codegen=True
+        )
+        def sampled(start):
+            return start
+        assert sampled(1) == 1 and sampled(2) == 2
+        assert sampler.stats()['sampled'] == 1
+
+    def test_async(self):
+        sampler = Sampler(rate=1.0)
+
+        @function_arguments(
+            start=Argument(type=str, validator=SlowCityValidator()),
+            sampling=sampler
+        )
+        async def sampled(**kwargs):
+            return sampled.arguments.get('start')
+        try:
+            asyncio.run(sampled(start='Lyon'))
+        except ValueError:
+            assert sampler.stats()['violations'] == 1
+        else:
+            assert False
+
+
+@class_properties(
+    name=Argument(type=str),
+    kind=Argument(type=str, choices=('car', 'bike'), default='car',
+                  read_only=False),
+    values=Argument(required=False),
+    attributes=True
+)
+class Attributed(ArgumentHandler):
+    __slots__ = ()
+
+
+class TestAttributes:
+
+    def test_read(self):
+        attributed = Attributed(name='Red car')
+        assert (attributed.name, attributed.kind) == ('Red car', 'car')
+
+    def test_set(self):
+        attributed = Attributed(name='Red car')
+        attributed.kind = 'bike'
+        assert attributed.get('kind') == 'bike'
+        assert attributed.values['kind'] == 'bike'
+
+    def test_set_read_only(self):
+        try:
+            Attributed(name='Red car').name = 'Blue car'
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_set_validation(self):
+        try:
+            Attributed(name='Red car').kind = 'truck'
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+    def test_existing_name(self):
+        attributed = Attributed(name='Red car', values=1)
+        assert attributed.get('values') == 1
+        assert dict(attributed.values)['values'] == 1
+
+    def test_delete(self):
+        try:
+            del Attributed(name='Red car').name
+        except AttributeError:
+            assert True
+        else:
+            assert False
+
+    def test_instance_attribute(self):
+        @class_properties(name=Argument(type=str))
+        class Labelled(ArgumentHandler):
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.name = self.get('name').upper()
+
+        labelled = Labelled(name='red car')
+        assert (labelled.name, labelled.get('name')) == ('RED CAR', 'red car')
+
+    def test_instance_attribute_read_only(self):
+        @class_properties(name=Argument(type=str), attributes=True)
+        class Labelled(ArgumentHandler):
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.name = self.get('name').upper()
+
+        try:
+            Labelled(name='red car')
+        except ValueError:
+            assert True
+        else:
+            assert False
+
+
+class ValidationCounter(Validator):
+    calls = 0
+
+    def validate(self, value) -> bool:
+        ValidationCounter.calls += 1
+        return True
+
+
+@class_properties(
+    name=Argument(type=str, validator=ValidationCounter()),
+    size=Argument(type=int, default=1, read_only=False),
+    attributes=True
+)
+class Parcel(ArgumentHandler):
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.label = f'parcel {self.name}'
+
+
+@class_properties(weight=Argument(type=int, default=0), attributes=True)
+class HeavyParcel(Parcel):
+    __slots__ = ('__carrier',)
+
+    def __init__(self, *args, carrier: str = '', **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__carrier = carrier
+
+    @property
+    def carrier(self) -> str:
+        return self.__carrier
+
+
+def parcel_name(parcel: Parcel) -> str:
+    return parcel.name
+
+
+class TestInPlaceClass:
+
+    def test_same_class(self):
+        assert type(Parcel(name='a')) is Parcel
+        assert Parcel.__qualname__ == 'Parcel'
+
+    def test_subclass_schema(self):
+        parcel = HeavyParcel(name='a', weight=3, carrier='post')
+        assert (parcel.name, parcel.weight, parcel.carrier) == (
+            'a', 3, 'post'
+        )
+        assert ArgumentHandler.get_schema(HeavyParcel).arguments.keys() == {
+            'weight'
+        }
+
+    def test_pickle(self):
+        parcel = Parcel(name='a', size=2)
+        calls = ValidationCounter.calls
+        restored = pickle.loads(pickle.dumps(parcel))
+        assert ValidationCounter.calls == calls
+        assert type(restored) is Parcel
+        assert dict(restored.values) == {'name': 'a', 'size': 2}
+        assert restored.label == 'parcel a'
+
+    def test_pickle_slots(self):
+        restored = pickle.loads(pickle.dumps(
+            HeavyParcel(name='a', weight=3, carrier='post')
+        ))
+        assert (restored.weight, restored.carrier) == (3, 'post')
+
+    def test_copy(self):
+        parcel = Parcel(name='a')
+        copied = copy.copy(parcel)
+        copied.size = 5
+        assert (parcel.size, copied.size) == (1, 5)
+        assert copy.deepcopy(parcel).get('name') == 'a'
+
+    def test_restored_validation(self):
+        restored = copy.copy(Parcel(name='a'))
+        try:
+            restored.size = 'large'
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(parcel_name, Parcel(name='a')).result() \
+                == 'a'
+
+
+class TestConstruct:
+
+    def test_no_validation(self):
+        calls = ValidationCounter.calls
+        parcel = Parcel.construct(name='a')
+        assert ValidationCounter.calls == calls
+        assert type(parcel) is Parcel
+
+    def test_defaults(self):
+        assert dict(Parcel.construct(name='a').values) == {
+            'name': 'a', 'size': 1
+        }
+
+    def test_trusted(self):
+        assert Parcel.construct(name=1).name == 1
+
+    def test_positional(self):
+        assert Point.construct(1).get('y') == 0
+
+    def test_dict_values(self):
+        assert Point.construct({'x': 1, 'y': 2}).get('y') == 2
+
+    def test_no_init(self):
+        assert not hasattr(Parcel.construct(name='a'), 'label')
+
+    def test_set_validates(self):
+        parcel = Parcel.construct(name='a')
+        try:
+            parcel.size = 'large'
+        except TypeError:
+            assert True
+        else:
+            assert False
+
+    def test_undecorated(self):
+        try:
+            ArgumentHandler.construct(name='a')
+        except KeyError:
+            assert True
+        else:
+            assert False
+
+
+class NoAttributes:
+    __slots__ = ('__weakref__',)
+
+
+def tenant_model(tenant: str) -> type:
+    @class_properties(tenant=Argument(type=str, default=tenant))
+    class Model(ArgumentHandler):
+        __slots__ = ()
+    return Model
+
+
+def tenant_function(tenant: str) -> Callable:
+    @function_arguments(tenant=Argument(type=str, default=tenant))
+    def function(**kwargs):
+        return function.arguments.get('tenant')
+    return function
+
+
+class TestIdentityRegistry:
+
+    def test_classes_do_not_collide(self):
+        first, second = tenant_model('first'), tenant_model('second')
+        assert first.__qualname__ == second.__qualname__
+        assert (first().get('tenant'), second().get('tenant')) == (
+            'first', 'second'
+        )
+
+    def test_functions_do_not_collide(self):
+        first, second = tenant_function('first'), tenant_function('second')
+        assert (first(), second()) == ('first', 'second')
+        assert ArgumentHandler.get_schema(second).defaults == {
+            'tenant': 'second'
+        }
+
+    def test_classes_are_released(self):
+        model = weakref.ref(tenant_model('released'))
+        gc.collect()
+        assert model() is None
+
+    def test_inherited_schema(self):
+        class Child(Parcel):
+            pass
+        assert ArgumentHandler.get_schema(Child) is (
+            ArgumentHandler.get_schema(Parcel)
+        )
+
+    def test_without_attributes(self):
+        decorated = NoAttributes()
+        schema = ArgumentHandler.set_arguments(
+            decorated,
+            {'size': Argument(type=int, default=1)}
+        )
+        assert ArgumentHandler.get_schema(decorated) is schema
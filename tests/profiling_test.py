@@ -0,0 +1,130 @@
+import asyncio
+
+from arganic import profiling
+from arganic.arguments import Argument, ArgumentHandler, function_arguments
+from arganic.validators import AsyncValidator, MaxLength
+
+
+class SlowEvenValidator(AsyncValidator):
+
+    async def validate_async(self, value) -> bool:
+        await asyncio.sleep(0)
+        if value % 2:
+            raise ValueError(f'{value} is odd.')
+        return True
+
+
+@function_arguments(
+    name=Argument(type=str, validator=MaxLength(5)),
+    size=Argument(type=int, default=1, choices=(1, 2))
+)
+def profiled(**kwargs):
+    return profiled.arguments.get('name')
+
+
+@function_arguments(name=Argument(type=str, validator=MaxLength(5)),
+                    codegen=True)
+def generated(name):
+    return name
+
+
+@function_arguments(number=Argument(type=int, validator=SlowEvenValidator()))
+async def awaited(**kwargs):
+    return awaited.arguments.get('number')
+
+
+class TestProfiling:
+
+    def setup_method(self):
+        profiling.enable()
+
+    def teardown_method(self):
+        profiling.disable()
+
+    def test_disabled(self):
+        profiling.disable()
+        profiled(name='a')
+        assert profiling.snapshot() == {
+            'targets': {}, 'rules': {}, 'validators': {}
+        }
+
+    def test_targets(self):
+        profiled(name='a')
+        profiled(name='b', size=2)
+        target = profiling.snapshot()['targets'][
+            ArgumentHandler.get_schema(profiled).name
+        ]
+        assert target['calls'] == 2
+        assert target['total'] >= target['p50'] > 0
+        assert target['failures'] == {}
+
+    def test_rules(self):
+        profiled(name='a')
+        name = ArgumentHandler.get_schema(profiled).name
+        assert sorted(profiling.snapshot()['rules']) == [
+            f'{name}.name:MaxLength',
+            f'{name}.name:required',
+            f'{name}.name:type',
+            f'{name}.size:choices',
+            f'{name}.size:type',
+        ]
+
+    def test_failures(self):
+        try:
+            profiled(name='too long')
+        except ValueError:
+            snapshot = profiling.snapshot()
+            name = ArgumentHandler.get_schema(profiled).name
+            assert snapshot['targets'][name]['failures'] == {
+                'name:MaxLength': 1
+            }
+            assert snapshot['validators']['MaxLength']['failures'] == {
+                'ValueError': 1
+            }
+        else:
+            assert False
+
+    def test_codegen(self):
+        generated('a')
+        name = ArgumentHandler.get_schema(generated).name
+        assert profiling.snapshot()['targets'][name]['calls'] == 1
+
+    def test_async(self):
+        assert asyncio.run(awaited(number=2)) == 2
+        validators = profiling.snapshot()['validators']
+        assert validators['SlowEvenValidator']['calls'] == 1
+
+    def test_hook(self):
+        recorded = []
+        profiling.enable(hook=lambda target, rule, seconds, reason: (
+            recorded.append((rule, reason))
+        ))
+        try:
+            generated(name=1)
+        except TypeError:
+            assert recorded == [('name:type', 'TypeError')]
+        else:
+            assert False
+
+    def test_reset(self):
+        profiled(name='a')
+        profiling.PROFILER.reset()
+        assert profiling.snapshot()['targets'] == {}
+
+
+class TestTiming:
+
+    def test_percentile(self):
+        timing = profiling.Timing(samples=100)
+        for index in range(1, 101):
+            timing.add(index)
+        assert timing.percentile(50) == 51
+        assert timing.percentile(99) == 100
+        assert timing.to_dict()['mean'] == 50.5
+
+    def test_samples(self):
+        timing = profiling.Timing(samples=2)
+        for seconds in (10, 1, 2):
+            timing.add(seconds)
+        assert timing.percentile(99) == 2
+        assert timing.calls == 3